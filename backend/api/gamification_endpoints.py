@@ -1,8 +1,8 @@
 """
 API endpoints for gamification features
 """
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
+from fastapi import APIRouter, HTTPException, Response
+from pydantic import BaseModel, TypeAdapter
 from typing import List, Optional, Dict, Any
 from datetime import date
 import logging
@@ -47,6 +47,10 @@ class LeaderboardEntry(BaseModel):
     lessons_completed: int
 
 
+# Built once at import; validates and encodes a whole leaderboard in pydantic-core
+_LEADERBOARD_ADAPTER = TypeAdapter(List[LeaderboardEntry])
+
+
 class UserStatsResponse(BaseModel):
     user_id: str
     total_points: int
@@ -185,7 +189,7 @@ async def get_user_stats(user_id: str):
         )
 
 
-@router.get("/leaderboard", response_model=List[LeaderboardEntry])
+@router.get("/leaderboard", response_model=None, responses={200: {"model": List[LeaderboardEntry]}})
 async def get_leaderboard(limit: int = 100, scope: str = "global"):
     """
     Get leaderboard rankings.
@@ -215,7 +219,8 @@ async def get_leaderboard(limit: int = 100, scope: str = "global"):
         scope=scope
     )
     
-    return [LeaderboardEntry(**entry) for entry in leaderboard]
+    entries = _LEADERBOARD_ADAPTER.validate_python(leaderboard)
+    return Response(content=_LEADERBOARD_ADAPTER.dump_json(entries), media_type="application/json")
 
 
 @router.get("/achievements")
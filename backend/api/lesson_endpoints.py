@@ -8,7 +8,7 @@ import logging
 import uuid
 from datetime import datetime
 
-from services.content_orchestrator import ContentOrchestrator
+from services.content_orchestrator import get_content_orchestrator
 from services.llm_service import LLMService
 from agents.lesson_synthesis_agent import LessonSynthesisAgent
 from agents.quiz_generation_agent import QuizGenerationAgent
@@ -19,7 +19,7 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/lessons", tags=["lessons"])
 
 # Initialize services (in production, use dependency injection)
-orchestrator = ContentOrchestrator()
+orchestrator = get_content_orchestrator()
 llm_service = LLMService()
 synthesis_agent = LessonSynthesisAgent(llm_service)
 quiz_agent = QuizGenerationAgent(llm_service)
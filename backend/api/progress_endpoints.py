@@ -1,11 +1,12 @@
 """
 Progress tracking API endpoints.
 """
+import asyncio
 import logging
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 from typing import Dict, Any, Optional
-from services.progress_service import get_progress_service
+from services.progress_service import get_progress_service, is_valid_uuid
 
 logger = logging.getLogger(__name__)
 
@@ -33,7 +34,7 @@ async def get_user_progress(user_id: str) -> Dict[str, Any]:
     """
     try:
         progress_service = get_progress_service()
-        progress = progress_service.get_user_progress(user_id)
+        progress = await asyncio.to_thread(progress_service.get_user_progress, user_id)
         return progress
     except Exception as e:
         logger.error(f"Error getting user progress: {e}")
@@ -49,7 +50,7 @@ async def get_user_stats(user_id: str) -> Dict[str, Any]:
     """
     try:
         progress_service = get_progress_service()
-        stats = progress_service.get_user_stats(user_id)
+        stats = await asyncio.to_thread(progress_service.get_user_stats, user_id)
         return stats
     except Exception as e:
         logger.error(f"Error getting user stats: {e}")
@@ -71,10 +72,13 @@ async def complete_lesson(
     
     Returns completion status and points earned.
     """
+    if not is_valid_uuid(user_id):
+        raise HTTPException(status_code=400, detail=f"Invalid user id: {user_id}")
+    
     try:
         progress_service = get_progress_service()
         time_spent = request.time_spent_seconds if request else 300
-        result = progress_service.complete_lesson(user_id, lesson_id, time_spent)
+        result = await asyncio.to_thread(progress_service.complete_lesson, user_id, lesson_id, time_spent)
         return result
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
@@ -98,7 +102,7 @@ async def get_daily_challenge_progress(user_id: str) -> Dict[str, Any]:
     """
     try:
         progress_service = get_progress_service()
-        progress = progress_service.get_daily_challenge_progress(user_id)
+        progress = await asyncio.to_thread(progress_service.get_daily_challenge_progress, user_id)
         return progress
     except Exception as e:
         logger.error(f"Error getting daily challenge progress: {e}")
@@ -10,7 +10,7 @@ from datetime import datetime
 
 from services.llm_service import LLMService
 from agents.quiz_generation_agent import QuizGenerationAgent
-from database import db
+from database import db, quiz_row_id
 
 logger = logging.getLogger(__name__)
 
@@ -152,11 +152,11 @@ async def generate_quiz(request: QuizGenerationRequest):
         try:
             client = db.client
             
-            # Store each question with the DB-generated ID
-            for question in questions:
-                db_id = str(uuid.uuid4())
-                quiz_data = {
-                    "id": db_id,
+            # Store all questions in one batched upsert; IDs derive from the
+            # question text so regenerating a lesson's quiz doesn't duplicate rows
+            quiz_rows = [
+                {
+                    "id": quiz_row_id(request.lesson_id, question.get("question")),
                     "lesson_id": request.lesson_id,
                     "question": question.get("question"),
                     "options": question.get("options", []),
@@ -165,12 +165,15 @@ async def generate_quiz(request: QuizGenerationRequest):
                     "points": 5,
                     "created_at": datetime.now().isoformat()
                 }
-                result = client.table("quizzes").insert(quiz_data).execute()
-                if result.data:
-                    # Update question ID to match DB ID for frontend
-                    question["id"] = db_id
-                    stored_count += 1
-                    logger.info(f"Stored question {db_id}")
+                for question in questions
+            ]
+            unique_rows = list({row["id"]: row for row in quiz_rows}.values())
+            result = client.table("quizzes").upsert(unique_rows, on_conflict="id").execute()
+            if result.data:
+                # Update question IDs to match DB IDs for frontend
+                for question, quiz_row in zip(questions, quiz_rows):
+                    question["id"] = quiz_row["id"]
+                stored_count = len(result.data)
             
             logger.info(f"Stored {stored_count}/{len(questions)} quiz questions for lesson {request.lesson_id}")
             
@@ -301,7 +304,6 @@ async def submit_quiz(request: QuizSubmissionRequest):
         # Store quiz result
         try:
             result_data = {
-                "id": str(uuid.uuid4()),
                 "user_id": request.user_id,
                 "quiz_id": request.quiz_id,
                 "lesson_id": request.quiz_id,  # Using quiz_id as lesson_id for now
@@ -342,7 +344,6 @@ async def submit_quiz(request: QuizSubmissionRequest):
                 else:
                     # Create new stats
                     new_stats = {
-                        "id": str(uuid.uuid4()),
                         "user_id": request.user_id,
                         "total_points": points_earned,
                         "quizzes_completed": 1,
@@ -458,9 +459,8 @@ async def generate_flashcards(request: FlashcardGenerationRequest):
             lesson_response = client.table("lessons").select("field_id").eq("id", request.lesson_id).execute()
             field_id = lesson_response.data[0]["field_id"] if lesson_response.data else "tech"
             
-            for card in flashcards:
-                flashcard_data = {
-                    "id": str(uuid.uuid4()),
+            flashcard_rows = [
+                {
                     "lesson_id": request.lesson_id,
                     "field_id": field_id,
                     "front": card.get("front"),
@@ -469,7 +469,9 @@ async def generate_flashcards(request: FlashcardGenerationRequest):
                     "topic": card.get("topic", "General"),
                     "created_at": datetime.now().isoformat()
                 }
-                client.table("flashcards").insert(flashcard_data).execute()
+                for card in flashcards
+            ]
+            client.table("flashcards").insert(flashcard_rows).execute()
             
             logger.info(f"Stored {len(flashcards)} flashcards for lesson {request.lesson_id}")
             
@@ -1,16 +1,32 @@
+import hashlib
 import os
+import uuid
 from supabase import create_client, Client
+from postgrest import AsyncPostgrestClient
+from postgrest.constants import DEFAULT_POSTGREST_CLIENT_HEADERS
 from typing import List, Dict, Optional, Any
 from datetime import datetime, date
 from dotenv import load_dotenv
 
 load_dotenv()
 
+
+def quiz_row_id(lesson_id: str, question: str) -> str:
+    """
+    Deterministic quizzes.id for a lesson's question.
+    Regenerating the same question upserts onto the existing row instead of
+    adding a duplicate.
+    """
+    digest = hashlib.blake2b(f"{lesson_id}|{question}".encode(), digest_size=16).digest()
+    return str(uuid.UUID(bytes=digest))
+
+
 class DatabaseService:
     def __init__(self):
         self.supabase_url = os.getenv("SUPABASE_URL")
         self.supabase_key = os.getenv("SUPABASE_ANON_KEY")
         self._client: Optional[Client] = None
+        self._rest: Optional[AsyncPostgrestClient] = None
     
     @property
     def client(self) -> Client:
@@ -21,6 +37,32 @@ class DatabaseService:
             self._client = create_client(self.supabase_url, self.supabase_key)
         return self._client
     
+    @property
+    def rest(self) -> AsyncPostgrestClient:
+        """
+        Lazy async PostgREST client for the hot read endpoints.
+        It holds one HTTP/2 keep-alive session, so concurrent requests are
+        multiplexed over a shared connection without blocking the event loop.
+        """
+        if self._rest is None:
+            if not self.supabase_url or not self.supabase_key:
+                raise ValueError("SUPABASE_URL and SUPABASE_ANON_KEY must be set in environment variables")
+            self._rest = AsyncPostgrestClient(
+                f"{self.supabase_url}/rest/v1",
+                headers={
+                    **DEFAULT_POSTGREST_CLIENT_HEADERS,
+                    "apikey": self.supabase_key,
+                    "Authorization": f"Bearer {self.supabase_key}",
+                },
+            )
+        return self._rest
+    
+    async def aclose(self):
+        """Close the async PostgREST session (called on app shutdown)"""
+        if self._rest is not None:
+            await self._rest.aclose()
+            self._rest = None
+    
     # Categories (Fields)
     async def get_categories(self) -> List[Dict[str, Any]]:
         response = self.client.table("categories").select("*").execute()
@@ -3,10 +3,8 @@ Free Content Generation Scheduler
 Generates 100 lessons/day using completely free services
 """
 import asyncio
-import schedule
-import time
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from services.auto_content_generator import get_generator
 
@@ -72,43 +70,42 @@ async def run_free_generation():
     logger.info("✨ Free content generation complete!")
 
 
-def run_async_job(coro):
-    """Helper to run async function in sync context."""
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    try:
-        loop.run_until_complete(coro)
-    finally:
-        loop.close()
+# Daily run time (local time)
+RUN_HOUR = 2
+RUN_MINUTE = 0
+
 
+def seconds_until_next_run(now: datetime) -> float:
+    """Seconds from now until the next RUN_HOUR:RUN_MINUTE."""
+    target = now.replace(hour=RUN_HOUR, minute=RUN_MINUTE, second=0, microsecond=0)
+    if target <= now:
+        target += timedelta(days=1)
+    return (target - now).total_seconds()
 
-def start_free_scheduler():
+
+async def start_free_scheduler():
     """
     Start the free content generation scheduler.
-    Generates 100 lessons daily at 2 AM.
+    Generates 100 lessons daily at 2 AM on one persistent event loop,
+    so the generator's HTTP/DB connections are reused between runs.
     """
     logger.info("🚀 Starting FREE content generation scheduler...")
-    logger.info("📅 Schedule: Daily at 2:00 AM")
+    logger.info("📅 Schedule: Daily at %d:%02d AM", RUN_HOUR, RUN_MINUTE)
     logger.info("📊 Target: 100 lessons per day")
     logger.info("💰 Cost: $0.00 per day")
     logger.info("🔧 Stack: Groq + HuggingFace + FFmpeg")
     
-    # Schedule daily generation at 2 AM
-    schedule.every().day.at("02:00").do(
-        lambda: run_async_job(run_free_generation())
-    )
-    
     # Optional: Run immediately for testing
     # logger.info("🧪 Running test generation...")
-    # run_async_job(run_free_generation())
+    # await run_free_generation()
     
     logger.info("⏰ Scheduler started. Waiting for 2:00 AM...")
     
-    # Keep running
     while True:
-        schedule.run_pending()
-        time.sleep(60)
+        # Recomputed every cycle so a long run doesn't shift later ones
+        await asyncio.sleep(seconds_until_next_run(datetime.now()))
+        await run_free_generation()
 
 
 if __name__ == "__main__":
-    start_free_scheduler()
+    asyncio.run(start_free_scheduler())
@@ -10,7 +10,7 @@ import logging
 # Add parent directory to path so we can import backend modules
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from services.auto_content_generator import AutoContentGenerator
+from services.auto_content_generator import get_generator
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -41,7 +41,7 @@ FIELD_TOPICS = {
 
 async def generate_lessons_for_all_fields():
     """Generate 1 easy lesson for each field (fast testing)."""
-    generator = AutoContentGenerator()
+    generator = get_generator()
     
     total_lessons = 0
     failed_lessons = 0
@@ -4,7 +4,7 @@ Creates curated curriculum with lesson outlines
 """
 import asyncio
 import sys
-from services.learning_path_service import LearningPathService
+from services.learning_path_service import get_learning_path_service
 from database import db
 
 async def generate_all_paths():
@@ -35,7 +35,7 @@ async def generate_all_paths():
         return
     
     # Generate paths for each field
-    service = LearningPathService()
+    service = get_learning_path_service()
     
     for field in fields:
         field_id = field['slug']
@@ -3,17 +3,34 @@ Generate Learning Paths with Full Content
 Creates curated curriculum AND generates complete lesson content
 """
 import asyncio
+import logging
+import queue
 import sys
-from services.learning_path_service import LearningPathService
-from services.content_orchestrator import ContentOrchestrator
+from logging.handlers import QueueHandler, QueueListener
+from services.learning_path_service import get_learning_path_service
+from services.content_orchestrator import get_content_orchestrator
+from services.rate_limiter import get_generation_rate_limiter
+from services.loop_watchdog import run_with_watchdog
 from database import db
 
+# Banner rule, built once
+BANNER = "=" * 60
+
+# Progress goes through a queue so the event loop never blocks on stdout;
+# the listener thread does the actual writes
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+logger.propagate = False
+_log_queue = queue.Queue(-1)
+logger.addHandler(QueueHandler(_log_queue))
+_log_listener = QueueListener(_log_queue, logging.StreamHandler(sys.stdout))
+
 async def generate_paths_with_content():
     """Generate learning paths with full lesson content"""
     
-    print("=" * 60)
+    print(BANNER)
     print("GENERATING LEARNING PATHS WITH FULL CONTENT")
-    print("=" * 60)
+    print(BANNER)
     print()
     print("⚠️  This will take longer and use API credits")
     print("   - Generates lesson structure")
@@ -23,7 +40,7 @@ async def generate_paths_with_content():
     
     # Get all fields
     try:
-        response = db.client.table("categories").select("id, name, slug").execute()
+        response = await asyncio.to_thread(db.client.table("categories").select("id, name, slug").execute)
         fields = response.data
         
         if not fields:
@@ -41,90 +58,95 @@ async def generate_paths_with_content():
         return
     
     # Services
-    path_service = LearningPathService()
-    orchestrator = ContentOrchestrator()
+    path_service = get_learning_path_service()
+    orchestrator = get_content_orchestrator()
     
     # Generate paths for each field
+    _log_listener.start()
+    try:
+        await _generate_field_paths(fields, path_service, orchestrator)
+    finally:
+        # Flush queued progress before the summary banner
+        _log_listener.stop()
+        await orchestrator.close_all()
+    
+    print(BANNER)
+    print("SUMMARY")
+    print(BANNER)
+    print()
+    print("✅ Learning paths with full content generated!")
+    print()
+    print("Next steps:")
+    print("1. View paths: GET /api/learning-paths/{field_id}")
+    print("2. Test in frontend: http://localhost:5173/curriculum")
+    print()
+
+async def _generate_field_paths(fields, path_service, orchestrator):
+    """Generate paths for each field, filling lesson content as they are built"""
+    limiter = get_generation_rate_limiter()
     for field in fields:
         field_id = field['slug']
         field_name = field['name']
         
-        print(f"📚 Generating paths for {field_name}...")
+        logger.info(f"📚 Generating paths for {field_name}...")
+        
+        async def generate_content(lesson):
+            """Generate full content for one lesson before it is saved"""
+            lesson_title = lesson['title']
+            try:
+                # Generate full content using Frankenstein system
+                # This creates detailed content, sources, etc.
+                async with limiter:
+                    result = await orchestrator.generate_lesson(
+                        field=field_name,
+                        topic=lesson_title,
+                        num_sources=3,
+                        generate_quiz=False,  # Can add later
+                        generate_video=False  # Set True for videos
+                    )
+                
+                if result and result.get('lesson'):
+                    lesson_data = result['lesson']
+                    logger.info(f"      {lesson['order_index'] + 1}. {lesson_title} ✅")
+                    return {
+                        'content': lesson_data.get('content', ''),
+                        'summary': lesson_data.get('summary', lesson['summary']),
+                        'learning_objectives': lesson_data.get('learning_objectives', []),
+                        'video_url': lesson_data.get('video_url'),
+                        'audio_url': lesson_data.get('audio_url'),
+                        'images': lesson_data.get('images'),
+                    }
+                
+                logger.warning(f"      {lesson['order_index'] + 1}. {lesson_title} ⚠️  Failed")
+                
+            except Exception as e:
+                logger.error(f"      {lesson['order_index'] + 1}. {lesson_title} ❌ Error: {e}")
+            
+            return None
         
         try:
-            # Step 1: Generate path structure
+            # Build path structure and lesson content in one pass;
+            # each path's lessons are saved once, with content
             paths = await path_service.generate_and_save_paths(
                 field_id=field_id,
                 field_name=field_name,
-                lessons_per_path=5
+                lessons_per_path=5,
+                content_generator=generate_content
             )
             
             if not paths:
-                print(f"⚠️  No paths generated")
+                logger.warning(f"⚠️  No paths generated")
                 continue
             
-            print(f"✅ Created {len(paths)} paths")
-            
-            # Step 2: Generate content for each lesson
+            logger.info(f"✅ Created {len(paths)} paths")
             for path in paths:
-                print(f"\n   📖 {path['name']}:")
-                
-                for i, lesson in enumerate(path.get('lessons', []), 1):
-                    lesson_id = lesson['id']
-                    lesson_title = lesson['title']
-                    
-                    print(f"      {i}. Generating: {lesson_title}...", end=" ")
-                    
-                    try:
-                        # Generate full content using Frankenstein system
-                        # This creates detailed content, sources, etc.
-                        result = await orchestrator.generate_lesson(
-                            field=field_name,
-                            topic=lesson_title,
-                            num_sources=3,
-                            generate_quiz=False,  # Can add later
-                            generate_video=False  # Set True for videos
-                        )
-                        
-                        if result and result.get('lesson'):
-                            lesson_data = result['lesson']
-                            
-                            # Update the path_lesson with full content
-                            db.client.table("path_lessons").update({
-                                'content': lesson_data.get('content', ''),
-                                'summary': lesson_data.get('summary', lesson['summary']),
-                                'learning_objectives': lesson_data.get('learning_objectives', []),
-                                'video_url': lesson_data.get('video_url'),
-                                'audio_url': lesson_data.get('audio_url'),
-                                'images': lesson_data.get('images'),
-                            }).eq('id', lesson_id).execute()
-                            
-                            print("✅")
-                        else:
-                            print("⚠️  Failed")
-                        
-                    except Exception as e:
-                        print(f"❌ Error: {e}")
-                    
-                    # Small delay to avoid rate limits
-                    await asyncio.sleep(2)
+                logger.info(f"   📖 {path['name']}: {len(path.get('lessons', []))} lessons")
             
         except Exception as e:
-            print(f"❌ Error: {e}")
+            logger.error(f"❌ Error: {e}")
         
-        print()
-    
-    print("=" * 60)
-    print("SUMMARY")
-    print("=" * 60)
-    print()
-    print("✅ Learning paths with full content generated!")
-    print()
-    print("Next steps:")
-    print("1. View paths: GET /api/learning-paths/{field_id}")
-    print("2. Test in frontend: http://localhost:5173/curriculum")
-    print()
+        logger.info("")
 
 if __name__ == "__main__":
-    asyncio.run(generate_paths_with_content())
+    asyncio.run(run_with_watchdog(generate_paths_with_content()))
 
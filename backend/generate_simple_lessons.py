@@ -3,9 +3,16 @@ Simple script to generate 2 lessons for each field
 Uses hardcoded field IDs to avoid database mismatches
 """
 import asyncio
-from services.auto_content_generator import AutoContentGenerator
+import functools
+from services.auto_content_generator import get_generator
+from services.rate_limiter import get_generation_rate_limiter
+from services.loop_watchdog import run_with_watchdog
 from database import db
 
+# Banner rules, built once
+BANNER = "=" * 70
+DIVIDER = "-" * 70
+
 # Field slug to name mapping
 FIELD_SLUGS = {
     'tech': 'Technology',
@@ -16,27 +23,26 @@ FIELD_SLUGS = {
     'global': 'Global Events'
 }
 
+# Reverse lookup: name -> slug
+_NAME_TO_SLUG = {name: slug for slug, name in FIELD_SLUGS.items()}
+
+@functools.lru_cache(maxsize=1)
+def _load_field_mappings():
+    """Query categories once per run; errors are not cached"""
+    response = db.client.table("categories").select("id, name").execute()
+    fields = response.data if response.data else []
+    
+    # Create mapping: slug -> {uuid, name}
+    return {
+        _NAME_TO_SLUG[field['name']]: {'uuid': field['id'], 'name': field['name']}
+        for field in fields
+        if field['name'] in _NAME_TO_SLUG
+    }
+
 def get_field_mappings():
     """Get UUID to slug mappings from database"""
     try:
-        response = db.client.table("categories").select("id, name").execute()
-        fields = response.data if response.data else []
-        
-        # Create mapping: name -> (uuid, slug)
-        mappings = {}
-        for field in fields:
-            name = field['name']
-            uuid = field['id']
-            # Find matching slug
-            slug = None
-            for s, n in FIELD_SLUGS.items():
-                if n == name:
-                    slug = s
-                    break
-            if slug:
-                mappings[slug] = {'uuid': uuid, 'name': name}
-        
-        return mappings
+        return _load_field_mappings()
     except Exception as e:
         print(f"Error getting field mappings: {e}")
         return {}
@@ -44,9 +50,9 @@ def get_field_mappings():
 async def generate_lessons():
     """Generate 2 lessons for each field"""
     
-    print("=" * 70)
+    print(BANNER)
     print("GENERATING 2 LESSONS FOR EACH FIELD")
-    print("=" * 70)
+    print(BANNER)
     print()
     
     # Get field mappings from database
@@ -61,7 +67,8 @@ async def generate_lessons():
         print(f"  • {info['name']} → {slug}")
     print()
     
-    generator = AutoContentGenerator()
+    generator = get_generator()
+    limiter = get_generation_rate_limiter()
     
     total_generated = 0
     total_failed = 0
@@ -69,14 +76,15 @@ async def generate_lessons():
     for slug, info in mappings.items():
         field_name = info['name']
         print(f"📚 {field_name} ({slug})")
-        print("-" * 70)
+        print(DIVIDER)
         
         try:
             # Use slug (tech, finance, etc.) for generation
-            lessons = await generator.generate_lessons_for_field(
-                field_id=slug,  # Use slug, not UUID
-                count=2
-            )
+            async with limiter:
+                lessons = await generator.generate_lessons_for_field(
+                    field_id=slug,  # Use slug, not UUID
+                    count=2
+                )
             
             if lessons:
                 print(f"✅ Generated {len(lessons)} lessons")
@@ -92,12 +100,11 @@ async def generate_lessons():
             total_failed += 1
         
         print()
-        await asyncio.sleep(3)  # Rate limit
     
-    print("=" * 70)
+    print(BANNER)
     print(f"✅ Generated: {total_generated} lessons")
     print(f"❌ Failed: {total_failed} fields")
-    print("=" * 70)
+    print(BANNER)
 
 if __name__ == "__main__":
-    asyncio.run(generate_lessons())
+    asyncio.run(run_with_watchdog(generate_lessons()))
@@ -10,6 +10,8 @@ from dotenv import load_dotenv
 sys.path.insert(0, os.path.dirname(__file__))
 load_dotenv()
 
+from services.loop_watchdog import run_with_watchdog
+
 # Fields to generate lessons for
 FIELDS = [
     {"id": "tech", "name": "Technology", "topic": "Latest AI and Machine Learning trends"},
@@ -21,11 +23,21 @@ FIELDS = [
 ]
 
 
+# Banner rule, built once
+BANNER = "=" * 60
+
+# Max fields generating at once (bounds concurrent LLM/API calls)
+MAX_CONCURRENT_FIELDS = 3
+
+
 async def generate_lesson(generator, field: dict, index: int):
     """Generate a single lesson for a field."""
-    print(f"\n{'='*60}")
-    print(f"[{index}/6] Generating {field['name']} lesson...")
-    print(f"{'='*60}")
+    # Buffer this field's output so concurrent fields don't interleave
+    output = [
+        "\n" + BANNER,
+        f"[{index}/6] Generating {field['name']} lesson...",
+        BANNER,
+    ]
     
     try:
         lessons = await generator.generate_lessons_for_field(
@@ -35,49 +47,59 @@ async def generate_lesson(generator, field: dict, index: int):
         
         if lessons and len(lessons) > 0:
             lesson = lessons[0]
-            print(f"✅ {field['name']}: {lesson.get('title', 'Untitled')}")
-            print(f"   📊 Difficulty: {lesson.get('difficulty_level')}")
-            print(f"   🎬 Video: {lesson.get('video_duration_seconds', 0)}s")
-            print(f"   🖼️  Images: {len(lesson.get('images', []))}")
-            print(f"   🔗 Video URL: {lesson.get('video_url', 'None')[:60]}..." if lesson.get('video_url') else "   🔗 Video URL: None")
+            output.append(f"✅ {field['name']}: {lesson.get('title', 'Untitled')}")
+            output.append(f"   📊 Difficulty: {lesson.get('difficulty_level')}")
+            output.append(f"   🎬 Video: {lesson.get('video_duration_seconds', 0)}s")
+            output.append(f"   🖼️  Images: {len(lesson.get('images', []))}")
+            output.append(f"   🔗 Video URL: {lesson.get('video_url', 'None')[:60]}..." if lesson.get('video_url') else "   🔗 Video URL: None")
             return lesson
         else:
-            print(f"❌ {field['name']}: Failed to generate")
+            output.append(f"❌ {field['name']}: Failed to generate")
             return None
             
     except Exception as e:
-        print(f"❌ {field['name']}: Error - {e}")
+        output.append(f"❌ {field['name']}: Error - {e}")
         return None
+    finally:
+        print("\n".join(output))
 
 
 async def main():
-    print("="*60)
+    print(BANNER)
     print("GENERATING 6 LESSONS (ONE PER FIELD)")
     print("Each lesson includes mascot video in 9:16 portrait format")
-    print("="*60)
+    print(BANNER)
     
-    from services.auto_content_generator import AutoContentGenerator
-    generator = AutoContentGenerator()
+    from services.auto_content_generator import get_generator
+    from services.rate_limiter import get_generation_rate_limiter
+    generator = get_generator()
+    limiter = get_generation_rate_limiter()
     
-    results = []
+    # Generate fields concurrently; the semaphore bounds in-flight
+    # fields and the shared token bucket paces call starts
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_FIELDS)
     
-    for i, field in enumerate(FIELDS, 1):
-        lesson = await generate_lesson(generator, field, i)
-        results.append({
+    async def run_field(index: int, field: dict):
+        async with semaphore, limiter:
+            return await generate_lesson(generator, field, index)
+    
+    lessons = await asyncio.gather(
+        *(run_field(i, field) for i, field in enumerate(FIELDS, 1))
+    )
+    
+    results = [
+        {
             "field": field['name'],
             "success": lesson is not None,
             "lesson": lesson
-        })
-        
-        # Small delay between lessons to avoid rate limits
-        if i < len(FIELDS):
-            print("\n⏳ Waiting 5 seconds before next lesson...")
-            await asyncio.sleep(5)
+        }
+        for field, lesson in zip(FIELDS, lessons)
+    ]
     
     # Summary
-    print("\n" + "="*60)
+    print("\n" + BANNER)
     print("GENERATION COMPLETE")
-    print("="*60)
+    print(BANNER)
     
     successful = sum(1 for r in results if r['success'])
     print(f"\n✅ Successfully generated: {successful}/{len(FIELDS)} lessons")
@@ -88,10 +110,10 @@ async def main():
         title = r['lesson'].get('title', 'N/A')[:40] if r['lesson'] else "Failed"
         print(f"  {status} {r['field']}: {title}")
     
-    print("\n" + "="*60)
+    print("\n" + BANNER)
     print("Check your Supabase database and storage bucket!")
-    print("="*60)
+    print(BANNER)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    asyncio.run(run_with_watchdog(main()))
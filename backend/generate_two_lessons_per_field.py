@@ -5,14 +5,61 @@ Uses the Frankenstein content generation system
 import asyncio
 import sys
 from database import db
-from services.auto_content_generator import AutoContentGenerator
+from services.auto_content_generator import get_generator
+from services.rate_limiter import get_generation_rate_limiter
+from services.loop_watchdog import run_with_watchdog
+
+# Banner rules, built once
+BANNER = "=" * 70
+DIVIDER = "-" * 70
+
+# Max fields generating at once (bounds concurrent LLM/API calls)
+MAX_CONCURRENT_FIELDS = 3
+
+async def generate_field_lessons(generator, field):
+    """Generate 2 lessons for one field; output is printed as one block"""
+    # Use slug (text) instead of UUID for field_id
+    field_id = field.get('slug', field['id'])
+    field_name = field['name']
+    
+    output = [
+        f"📚 Generating lessons for {field_name}...",
+        DIVIDER,
+    ]
+    lessons = []
+    
+    try:
+        # Generate 2 lessons
+        lessons = await generator.generate_lessons_for_field(
+            field_id=field_id,
+            count=2
+        )
+        
+        if lessons:
+            output.append(f"✅ Generated {len(lessons)} lessons for {field_name}")
+            for i, lesson in enumerate(lessons, 1):
+                output.append(f"   {i}. {lesson.get('title', 'Untitled')}")
+                output.append(f"      Content: {len(lesson.get('content', ''))} chars")
+                if lesson.get('video_url'):
+                    output.append(f"      Video: {lesson.get('video_url')[:60]}...")
+                output.append(f"      Images: {len(lesson.get('images', []))}")
+        else:
+            output.append(f"⚠️  No lessons generated for {field_name}")
+            
+    except Exception as e:
+        output.append(f"❌ Error generating lessons for {field_name}: {e}")
+        lessons = []
+    
+    print("\n".join(output))
+    print()
+    return lessons or []
 
 async def generate_lessons_for_all_fields():
     """Generate 2 lessons for each field"""
     
-    print("=" * 70)
+    print(BANNER)
     print("GENERATING 2 LESSONS FOR EACH FIELD")
-    print("=" * 70)
+    print(BANNER)
     print()
     
     # Get all fields from database
@@ -34,52 +81,24 @@ async def generate_lessons_for_all_fields():
     print()
     
     # Initialize generator
-    generator = AutoContentGenerator()
+    generator = get_generator()
     
-    # Generate 2 lessons for each field
-    total_generated = 0
-    total_failed = 0
+    # Generate 2 lessons for each field, several fields at a time
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_FIELDS)
+    limiter = get_generation_rate_limiter()
     
-    for field in fields:
-        # Use slug (text) instead of UUID for field_id
-        field_id = field.get('slug', field['id'])
-        field_name = field['name']
-        
-        print(f"📚 Generating lessons for {field_name}...")
-        print("-" * 70)
-        
-        try:
-            # Generate 2 lessons
-            lessons = await generator.generate_lessons_for_field(
-                field_id=field_id,
-                count=2
-            )
-            
-            if lessons:
-                print(f"✅ Generated {len(lessons)} lessons for {field_name}")
-                for i, lesson in enumerate(lessons, 1):
-                    print(f"   {i}. {lesson.get('title', 'Untitled')}")
-                    print(f"      Content: {len(lesson.get('content', ''))} chars")
-                    if lesson.get('video_url'):
-                        print(f"      Video: {lesson.get('video_url')[:60]}...")
-                    print(f"      Images: {len(lesson.get('images', []))}")
-                total_generated += len(lessons)
-            else:
-                print(f"⚠️  No lessons generated for {field_name}")
-                total_failed += 1
-                
-        except Exception as e:
-            print(f"❌ Error generating lessons for {field_name}: {e}")
-            total_failed += 1
-        
-        print()
-        
-        # Small delay between fields to avoid rate limits
-        await asyncio.sleep(3)
+    async def run_field(field):
+        async with semaphore, limiter:
+            return await generate_field_lessons(generator, field)
+    
+    results = await asyncio.gather(*(run_field(field) for field in fields))
+    
+    total_generated = sum(len(lessons) for lessons in results)
+    total_failed = sum(1 for lessons in results if not lessons)
     
-    print("=" * 70)
+    print(BANNER)
     print("SUMMARY")
-    print("=" * 70)
+    print(BANNER)
     print(f"✅ Total lessons generated: {total_generated}")
     print(f"❌ Fields failed: {total_failed}")
     print()
@@ -93,4 +112,4 @@ async def generate_lessons_for_all_fields():
         print()
 
 if __name__ == "__main__":
-    asyncio.run(generate_lessons_for_all_fields())
+    asyncio.run(run_with_watchdog(generate_lessons_for_all_fields()))
@@ -1,17 +1,24 @@
-from fastapi import FastAPI, HTTPException, Depends
+from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import List, Optional, Dict
-import os
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
+from typing import List, Optional, Sequence
+from contextlib import asynccontextmanager
+import asyncio
+import hashlib
 import logging
-import uuid
+import orjson
+from collections import defaultdict
 from datetime import datetime, date
 from dotenv import load_dotenv
 
 logger = logging.getLogger(__name__)
 
 from database import db
-from models import *
+from models import Field, Lesson, DailyChallenge, DifficultyLevel, NewsItem
+from services.cache_service import get_cache
+from services.content_orchestrator import get_content_orchestrator
+from seed_data import get_seed_data
 from api.lesson_endpoints import router as lesson_router
 from api.gamification_endpoints import router as gamification_router
 from api.quiz_endpoints import router as quiz_router
@@ -25,7 +32,16 @@ from api.progress_endpoints import router as progress_router
 
 load_dotenv()
 
-app = FastAPI(title="MindForge API", version="1.0.0")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Release the shared PostgREST HTTP/2 session and the adapters' pooled
+    # HTTP sessions
+    await db.aclose()
+    await get_content_orchestrator().close_all()
+
+# orjson encodes responses several times faster than the stdlib json module
+app = FastAPI(title="MindForge API", version="1.0.0", default_response_class=ORJSONResponse, lifespan=lifespan)
 
 # Add CORS middleware - allow all origins for Vercel deployment
 app.add_middleware(
@@ -74,6 +90,69 @@ app.include_router(progress_router)
 
 # Field definitions (moved to models.py)
 
+# Seed lessons indexed once at import and frozen into tuples; served as-is
+# (no per-request copies) when the lessons table is unreachable
+_SEED_LESSONS = tuple(get_seed_data()["lessons"])
+_SEED_LESSONS_BY_ID = {lesson.id: lesson for lesson in _SEED_LESSONS}
+_seed_by_field = defaultdict(list)
+_seed_ids_by_difficulty = defaultdict(set)
+for _lesson in _SEED_LESSONS:
+    _seed_by_field[_lesson.field_id].append(_lesson)
+    _seed_ids_by_difficulty[_lesson.difficulty_level.lower()].add(_lesson.id)
+_SEED_LESSONS_BY_FIELD = {field_id: tuple(lessons) for field_id, lessons in _seed_by_field.items()}
+_SEED_LESSON_IDS_BY_DIFFICULTY = {
+    difficulty: frozenset(lesson_ids) for difficulty, lesson_ids in _seed_ids_by_difficulty.items()
+}
+del _seed_by_field, _seed_ids_by_difficulty, _lesson
+
+# Only listings for known filters are cached, so arbitrary query strings
+# can't grow the process-wide cache without bound
+_CACHEABLE_FIELD_IDS = frozenset(field.id for field in get_seed_data()["fields"])
+_CACHEABLE_DIFFICULTIES = frozenset(level.value for level in DifficultyLevel)
+
+# Built once: serializes Lesson sequences straight to JSON bytes in pydantic-core
+_LESSON_LIST_ADAPTER = TypeAdapter(Sequence[Lesson])
+
+# Columns returned for full lessons; the large base64 media columns are only
+# fetched when requested through ?include=
+_LESSON_COLUMNS = (
+    "id,title,content,field_id,field_name,difficulty_level,estimated_minutes,"
+    "learning_objectives,key_concepts,video_url,video_duration_seconds,sources,"
+    "is_auto_generated,created_at"
+)
+_LESSON_DETAIL_COLUMNS = _LESSON_COLUMNS + ",quiz_questions"
+_LESSON_MEDIA_COLUMNS = ("images", "audio", "audio_clips")
+_INCLUDE_DESCRIPTION = "Comma-separated media columns to add: images, audio, audio_clips"
+
+# Upper bound on ?ids= so the primary-key IN filter stays small
+_MAX_LESSON_IDS = 50
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Whether an If-None-Match header matches etag: "*" or any listed tag,
+    compared weakly (a W/ prefix is ignored)
+    """
+    if not if_none_match:
+        return False
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == etag:
+            return True
+    return False
+
+def _select_columns(base: str, include: Optional[str]) -> str:
+    """Add the media columns listed in include to a column list"""
+    requested = {c.strip() for c in include.split(",")} if include else set()
+    return ",".join([base, *(c for c in _LESSON_MEDIA_COLUMNS if c in requested)])
+
+def _get_seed_lessons(field_id: Optional[str] = None, difficulty: Optional[str] = None) -> Sequence[Lesson]:
+    """Filter seed lessons using the prebuilt field/difficulty indexes"""
+    lessons = _SEED_LESSONS_BY_FIELD.get(field_id, ()) if field_id else _SEED_LESSONS
+    if difficulty:
+        lesson_ids = _SEED_LESSON_IDS_BY_DIFFICULTY.get(difficulty.lower(), frozenset())
+        lessons = tuple(lesson for lesson in lessons if lesson.id in lesson_ids)
+    return lessons
+
 @app.get("/")
 async def root():
     return {"message": "MindForge Learning Platform API is running"}
@@ -90,100 +169,143 @@ async def options_handler(full_path: str):
     return {}
 
 # Fields endpoints
-@app.get("/api/fields", response_model=List[Field])
+async def _load_fields() -> list:
+    """Read the categories table and map rows to the fields format"""
+    response = await db.rest.from_("categories").select("*").execute()
+    fields = []
+    if response.data:
+        for cat in response.data:
+            fields.append({
+                "id": cat.get("slug", cat["id"]),
+                "name": cat["name"],
+                "description": cat.get("description", ""),
+                "icon": cat.get("icon", "📚"),
+                "color": cat.get("color", "#3B82F6"),
+                "total_lessons": 0,  # Will be calculated
+                "created_at": cat.get("created_at")
+            })
+    return fields
+
+# Rows come straight from the categories table, so skip outbound validation;
+# the model is still listed for the OpenAPI schema
+@app.get("/api/fields", response_model=None, responses={200: {"model": List[Field]}})
 async def get_fields():
+    # Categories change rarely: the encoded list is kept for an hour
+    # (or until /api/fields/refresh), so hits skip the query and the encoding
+    cache = get_cache()
+    cached_body = await cache.get(source="fields", topic="all")
+    if cached_body is not None:
+        return Response(content=cached_body, media_type="application/json")
+
     try:
-        response = db.client.table("categories").select("*").execute()
-        # Map categories to fields format
-        fields = []
-        if response.data:
-            for cat in response.data:
-                fields.append({
-                    "id": cat.get("slug", cat["id"]),
-                    "name": cat["name"],
-                    "description": cat.get("description", ""),
-                    "icon": cat.get("icon", "📚"),
-                    "color": cat.get("color", "#3B82F6"),
-                    "total_lessons": 0,  # Will be calculated
-                    "created_at": cat.get("created_at")
-                })
-        return fields
+        body = orjson.dumps(await _load_fields())
+        await cache.set(source="fields", topic="all", value=body)
+        return Response(content=body, media_type="application/json")
     except Exception as e:
         logger.error(f"Error fetching fields: {e}")
         # Return empty list instead of error to prevent deployment issues
         return []
 
+@app.post("/api/fields/refresh")
+async def refresh_fields():
+    """Drop the cached fields list so the next read goes back to the database"""
+    await get_cache().invalidate_pattern(source="fields", topic="all")
+    return {"status": "success"}
+
 # Lessons endpoints
-@app.get("/api/lessons", response_model=List[Lesson])
-async def get_lessons(field_id: Optional[str] = None, difficulty: Optional[str] = None):
+@app.get("/api/lessons", response_model=None, responses={200: {"model": List[Lesson]}})
+async def get_lessons(
+    field_id: Optional[str] = None,
+    difficulty: Optional[str] = None,
+    ids: Optional[str] = Query(None, description="Comma-separated lesson IDs to fetch in one query"),
+    include: Optional[str] = Query(None, description=_INCLUDE_DESCRIPTION)
+):
     """
     Get all lessons (both seed data and AI-generated).
     AI-generated lessons take priority.
+    Pass `ids` to fetch several full lessons at once instead of one
+    /api/lessons/{lesson_id} call per lesson (at most 50; media columns
+    only when listed in `include`).
     """
+    if ids:
+        lesson_ids = [i.strip() for i in ids.split(",") if i.strip()]
+        if len(lesson_ids) > _MAX_LESSON_IDS:
+            raise HTTPException(status_code=400, detail=f"At most {_MAX_LESSON_IDS} ids per request")
+        return await _get_lessons_by_ids(lesson_ids, include)
+    
+    # The listing is cached briefly as encoded JSON, per known filter combination
+    cache = get_cache()
+    cache_topic = f"{field_id}:{difficulty}"
+    cacheable = (
+        (field_id is None or field_id in _CACHEABLE_FIELD_IDS)
+        and (difficulty is None or difficulty in _CACHEABLE_DIFFICULTIES)
+    )
+    if cacheable:
+        cached_body = await cache.get(source="lessons", topic=cache_topic)
+        if cached_body is not None:
+            return Response(content=cached_body, media_type="application/json")
+    
     try:
-        lessons = []
+        # list_lessons (migrations 009, 012) shapes and aggregates the
+        # list-view rows in SQL; the result only needs encoding
+        response = await db.rest.rpc("list_lessons", {
+            "p_field_id": field_id,
+            "p_difficulty": difficulty,
+        }).execute()
+        body = orjson.dumps(response.data or [])
+        if cacheable:
+            await cache.set(source="lessons", topic=cache_topic, value=body)
+        return Response(content=body, media_type="application/json")
         
-        # Get auto-generated lessons from lessons table (from auto_content_generator)
-        # Select only needed columns (exclude large images/audio columns for list view)
-        query = db.client.table("lessons").select(
-            "id,title,content,field_id,field_name,difficulty_level,estimated_minutes,"
-            "learning_objectives,key_concepts,video_url,video_duration_seconds,sources,"
-            "is_auto_generated,created_at"
+    except Exception as e:
+        logger.error(f"Error fetching lessons, serving seed data: {e}")
+        return Response(
+            content=_LESSON_LIST_ADAPTER.dump_json(_get_seed_lessons(field_id, difficulty)),
+            media_type="application/json"
         )
-        
-        if field_id:
-            query = query.eq("field_id", field_id)
-        if difficulty:
-            query = query.eq("difficulty_level", difficulty)
-            
-        response = query.order("created_at", desc=True).limit(50).execute()
-        auto_lessons = response.data
-        
-        # Add auto-generated lessons
-        for lesson in auto_lessons:
-            # Normalize difficulty level to lowercase
-            difficulty = lesson.get("difficulty_level", "beginner")
-            if isinstance(difficulty, str):
-                difficulty = difficulty.lower()
-            
-            lessons.append({
-                "id": lesson["id"],
-                "field_id": lesson.get("field_id", "tech"),
-                "field_name": lesson.get("field_name", "Technology"),
-                "title": lesson["title"],
-                "content": lesson.get("content", "")[:500],  # Truncate for list view
-                "difficulty_level": difficulty,
-                "estimated_minutes": lesson.get("estimated_minutes", 15),
-                "learning_objectives": lesson.get("learning_objectives", []),
-                "key_concepts": lesson.get("key_concepts", []),
-                "video_url": lesson.get("video_url"),
-                "video_duration_seconds": lesson.get("video_duration_seconds"),
-                "sources": lesson.get("sources", []),
-                "created_at": lesson.get("created_at"),
-                "is_generated": True,
-                "is_auto_generated": lesson.get("is_auto_generated", False)
-            })
-        
-        return lessons
-        
+
+async def _get_lessons_by_ids(lesson_ids: List[str], include: Optional[str] = None) -> Response:
+    """Fetch full lessons for several IDs with a single primary-key IN query"""
+    try:
+        response = await db.rest.from_("lessons").select(
+            _select_columns(_LESSON_COLUMNS, include)
+        ).in_("id", lesson_ids).execute()
+        lessons_by_id = {lesson["id"]: lesson for lesson in response.data or []}
     except Exception as e:
-        logger.error(f"Error fetching lessons: {e}")
-        raise HTTPException(status_code=500, detail=f"Error fetching lessons: {str(e)}")
+        logger.error(f"Error fetching lessons {lesson_ids}, serving seed data: {e}")
+        seed_lessons = [_SEED_LESSONS_BY_ID[i] for i in lesson_ids if i in _SEED_LESSONS_BY_ID]
+        return Response(content=_LESSON_LIST_ADAPTER.dump_json(seed_lessons), media_type="application/json")
+    
+    # Keep the requested order; unknown IDs are skipped
+    return ORJSONResponse([lessons_by_id[lesson_id] for lesson_id in lesson_ids if lesson_id in lessons_by_id])
 
-@app.get("/api/lessons/{lesson_id}", response_model=Lesson)
-async def get_lesson(lesson_id: str):
+# The row was validated on write; return it as-is instead of re-validating
+@app.get("/api/lessons/{lesson_id}", response_model=None, responses={200: {"model": Lesson}})
+async def get_lesson(
+    request: Request,
+    lesson_id: str,
+    include: Optional[str] = Query(None, description=_INCLUDE_DESCRIPTION)
+):
     """
-    Get a specific lesson by ID.
+    Get a specific lesson by ID, with its quiz questions.
+    Media columns are left out unless listed in `include`.
+    Responses carry an ETag; a matching If-None-Match gets an empty 304.
     """
+    columns = _select_columns(_LESSON_DETAIL_COLUMNS, include)
     try:
-        # Get from lessons table
-        response = db.client.table("lessons").select("*").eq("id", lesson_id).execute()
+        # lesson_detail_v (migration 007) joins the related rows in one query
+        response = await db.rest.from_("lesson_detail_v").select(columns).eq("id", lesson_id).execute()
         if response.data:
             lesson = response.data[0]
-            # Normalize difficulty level to lowercase
-            if "difficulty_level" in lesson and isinstance(lesson["difficulty_level"], str):
-                lesson["difficulty_level"] = lesson["difficulty_level"].lower()
-            return lesson
+            
+            # Hash the encoded body rather than updated_at: quiz_questions come
+            # from another table and change without touching the lesson row
+            body = orjson.dumps(lesson)
+            etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+            headers = {"ETag": etag, "Cache-Control": "private, max-age=60"}
+            if _etag_matches(request.headers.get("if-none-match"), etag):
+                return Response(status_code=304, headers=headers)
+            return Response(content=body, media_type="application/json", headers=headers)
             
         raise HTTPException(status_code=404, detail="Lesson not found")
         
@@ -191,6 +313,8 @@ async def get_lesson(lesson_id: str):
         raise
     except Exception as e:
         logger.error(f"Error fetching lesson {lesson_id}: {e}")
+        if lesson_id in _SEED_LESSONS_BY_ID:
+            return Response(content=_SEED_LESSONS_BY_ID[lesson_id].model_dump_json(), media_type="application/json")
         raise HTTPException(status_code=500, detail=f"Error fetching lesson: {str(e)}")
 
 # Quiz endpoints are handled by quiz_router (quiz_endpoints.py)
@@ -199,10 +323,15 @@ async def get_lesson(lesson_id: str):
 @app.post("/api/lessons/{lesson_id}/complete")
 async def complete_lesson(lesson_id: str, user_id: str = "user_1"):
     """Mark a lesson as completed for a user. (Legacy endpoint - use /api/progress instead)"""
+    from services.progress_service import get_progress_service, is_valid_uuid
+    if not is_valid_uuid(user_id):
+        raise HTTPException(status_code=400, detail=f"Invalid user id: {user_id}")
+    
     try:
-        from services.progress_service import get_progress_service
         progress_service = get_progress_service()
-        result = progress_service.complete_lesson(user_id, lesson_id, time_spent_seconds=300)
+        result = await asyncio.to_thread(
+            progress_service.complete_lesson, user_id, lesson_id, time_spent_seconds=300
+        )
         return result
     except Exception as e:
         logger.error(f"Error completing lesson: {e}")
@@ -210,26 +339,41 @@ async def complete_lesson(lesson_id: str, user_id: str = "user_1"):
         return {"status": "success", "points_earned": 10, "warning": str(e)}
 
 # Daily challenges
-@app.get("/api/daily-challenge", response_model=DailyChallenge)
-async def get_daily_challenge():
-    # TODO: Implement daily challenge generation
-    return DailyChallenge(
+# The daily challenge is static apart from its dates, so it is validated and
+# encoded once at import; requests only substitute the placeholders
+_DAILY_CHALLENGE_TEMPLATE = orjson.dumps({
+    **DailyChallenge(
         id="daily_001",
         title="AI & Machine Learning Fundamentals",
         description="Complete 3 lessons and quiz on AI basics",
         field_id="tech",
         lesson_ids=["lesson_1", "lesson_2", "lesson_3"],
         quiz_ids=["quiz_1"],
-        date=date.today(),
+        date=date.min,
         difficulty_level=DifficultyLevel.INTERMEDIATE,
-        created_at=datetime.now()
-    )
+    ).model_dump(mode="json"),
+    "date": "__DATE__",
+    "created_at": "__CREATED_AT__",
+})
+
+@app.get("/api/daily-challenge", response_model=None, responses={200: {"model": DailyChallenge}})
+async def get_daily_challenge():
+    # TODO: Implement daily challenge generation
+    cache = get_cache()
+    today = date.today().isoformat()
+    payload = await cache.get(source="daily_challenge", topic=today)
+    if payload is None:
+        payload = _DAILY_CHALLENGE_TEMPLATE.replace(b"__DATE__", today.encode()).replace(
+            b"__CREATED_AT__", datetime.now().isoformat().encode()
+        )
+        await cache.set(source="daily_challenge", topic=today, value=payload)
+    return Response(content=payload, media_type="application/json")
 
 # News endpoints
-@app.get("/api/news/{field_id}", response_model=List[NewsItem])
+@app.get("/api/news/{field_id}", response_model=None, responses={200: {"model": List[NewsItem]}})
 async def get_field_news(field_id: str, limit: int = 10):
     # TODO: Implement news integration
-    return []
+    return ORJSONResponse([])
 
 if __name__ == "__main__":
     import uvicorn
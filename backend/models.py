@@ -1,8 +1,18 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import List, Optional, Dict, Any
 from datetime import datetime, date
 from enum import Enum
 
+__all__ = [
+    "DifficultyLevel", "QuestionType", "RESPONSE_MODEL_CONFIG",
+    "Field", "Lesson", "QuizQuestion", "QuizSubmission", "QuizResult",
+    "UserProgress", "DailyChallenge", "NewsItem", "User", "TABLES",
+    "SourceAttribution", "SynthesizedLesson", "Reflection", "ReflectionFeedback",
+    "Achievement", "UserAchievement", "LeaderboardEntry", "SessionType",
+    "ScheduledSession", "SchedulePreferences", "ReflectionPrompt", "UserStats",
+    "PathLesson", "LearningPath", "Flashcard",
+]
+
 # Enums
 class DifficultyLevel(str, Enum):
     BEGINNER = "beginner"
@@ -15,8 +25,14 @@ class QuestionType(str, Enum):
     TRUE_FALSE = "true_false"
     FILL_BLANK = "fill_blank"
 
+# Response models: unknown DB columns are dropped, defaults are not
+# re-validated, and instances are immutable once built
+RESPONSE_MODEL_CONFIG = ConfigDict(extra="ignore", validate_default=False, frozen=True)
+
 # Base Models
 class Field(BaseModel):
+    model_config = RESPONSE_MODEL_CONFIG
+    
     id: str
     name: str
     description: str
@@ -26,6 +42,8 @@ class Field(BaseModel):
     created_at: Optional[datetime] = None
 
 class Lesson(BaseModel):
+    model_config = RESPONSE_MODEL_CONFIG
+    
     id: str
     title: str
     content: str
@@ -46,6 +64,8 @@ class Lesson(BaseModel):
     updated_at: Optional[datetime] = None
 
 class QuizQuestion(BaseModel):
+    model_config = RESPONSE_MODEL_CONFIG
+    
     id: str
     lesson_id: str
     question: str
@@ -99,6 +119,8 @@ class DailyChallenge(BaseModel):
     created_at: Optional[datetime] = None
 
 class NewsItem(BaseModel):
+    model_config = RESPONSE_MODEL_CONFIG
+    
     id: str
     title: str
     summary: str
@@ -1,10 +1,9 @@
 """
-Background Scheduler for Automatic Content Generation
-Runs daily to generate fresh lessons
+Daily Content Generation Job
+Generates fresh lessons once per invocation; scheduled by a systemd timer
+(see deploy/mindforge-scheduler.timer)
 """
 import asyncio
-import schedule
-import time
 import logging
 from datetime import datetime
 
@@ -16,66 +15,50 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+BANNER = "=" * 50
+
 
 async def run_daily_generation():
     """Run the daily content generation job."""
-    logger.info("=" * 50)
-    logger.info("Starting daily content generation job")
-    logger.info(f"Time: {datetime.now().isoformat()}")
-    logger.info("=" * 50)
+    logger.info(
+        "%s\nStarting daily content generation job\nTime: %s\n%s",
+        BANNER, datetime.now().isoformat(), BANNER
+    )
     
     try:
         generator = get_generator()
-        lessons = await generator.generate_daily_content()
         
-        logger.info(f"✓ Successfully generated {len(lessons)} lessons")
+        async def count_generated() -> int:
+            # Only the count is needed, so consume lessons as they're produced
+            count = 0
+            async for _ in generator.stream_daily_content():
+                count += 1
+            return count
+        
+        # Cleanup only touches lessons 30+ days old, so it can overlap generation
+        generated, cleaned = await asyncio.gather(
+            count_generated(),
+            generator.cleanup_old_lessons(days_old=30),
+            return_exceptions=True
+        )
+        
+        if isinstance(generated, BaseException):
+            logger.error("✗ Daily generation failed: %s", generated, exc_info=generated)
+        else:
+            logger.info("✓ Successfully generated %d lessons", generated)
         
-        # Also cleanup old lessons (30+ days old)
-        await generator.cleanup_old_lessons(days_old=30)
-        logger.info("✓ Cleaned up old lessons")
+        if isinstance(cleaned, BaseException):
+            logger.error("✗ Cleanup of old lessons failed: %s", cleaned, exc_info=cleaned)
+        else:
+            logger.info("✓ Cleaned up old lessons")
         
     except Exception as e:
-        logger.error(f"✗ Daily generation failed: {e}", exc_info=True)
-    
-    logger.info("=" * 50)
-    logger.info("Daily content generation job complete")
-    logger.info("=" * 50)
-
-
-def run_async_job(coro):
-    """Helper to run async function in sync context."""
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    try:
-        loop.run_until_complete(coro)
-    finally:
-        loop.close()
-
-
-def start_scheduler():
-    """
-    Start the background scheduler.
-    Generates content daily at 2 AM.
-    """
-    logger.info("Starting content generation scheduler...")
-    logger.info("Schedule: Daily at 2:00 AM")
-    logger.info("Targets: 8 lessons per day across all fields")
-    
-    # Schedule daily generation at 2 AM
-    schedule.every().day.at("02:00").do(
-        lambda: run_async_job(run_daily_generation())
-    )
-    
-    # Optional: Run immediately on startup for testing
-    # run_async_job(run_daily_generation())
-    
-    logger.info("Scheduler started. Waiting for scheduled time...")
+        logger.error("✗ Daily generation failed: %s", e, exc_info=True)
     
-    # Keep running
-    while True:
-        schedule.run_pending()
-        time.sleep(60)  # Check every minute
+    logger.info("%s\nDaily content generation job complete\n%s", BANNER, BANNER)
 
 
 if __name__ == "__main__":
-    start_scheduler()
+    # Runs one generation pass and exits. The daily 2 AM trigger comes from
+    # deploy/mindforge-scheduler.timer (systemd) rather than a resident loop.
+    asyncio.run(run_daily_generation())
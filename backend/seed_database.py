@@ -6,40 +6,88 @@ Run this script to populate your database with sample lessons, fields, and quiz
 
 import os
 import sys
+import orjson
 from dotenv import load_dotenv
 from database import db
-from seed_data import get_seed_data
+from collections import Counter
+from itertools import islice
+from seed_data import get_seed_fields, get_seed_quiz_questions, iter_seed_lessons
 
 load_dotenv()
 
+# Max rows per table in one seed_all call; keeps request payloads well
+# under PostgREST's body limit as seed content grows
+SEED_BATCH_SIZE = 500
+
+
+def _chunked(rows, size=SEED_BATCH_SIZE):
+    """Yield lists of at most size rows from any iterable"""
+    it = iter(rows)
+    while batch := list(islice(it, size)):
+        yield batch
+
+
+def _seed_all(client, fields, lessons, quiz_questions):
+    """
+    Upsert one batch of rows through the seed_all RPC.
+    The body is encoded with orjson (datetimes and enums natively) and posted
+    on the client's PostgREST session, skipping the json.dumps round-trip.
+    Returns the per-table counts of rows actually written.
+    """
+    response = client.postgrest.session.post(
+        "rpc/seed_all",
+        content=orjson.dumps({
+            "p_fields": fields,
+            "p_lessons": lessons,
+            "p_quiz_questions": quiz_questions
+        }),
+        headers={"Content-Type": "application/json"}
+    )
+    response.raise_for_status()
+    return response.json()
+
+
 def seed_database():
     """Seed the database with initial data"""
     print("🌱 Starting database seeding...")
     
     try:
         client = db.client
-        seed_data = get_seed_data()
         
-        # Seed Fields
-        print("📚 Seeding fields...")
-        fields_response = client.table("fields").upsert(
-            [field.dict() for field in seed_data["fields"]]
-        ).execute()
-        print(f"✅ Seeded {len(seed_data['fields'])} fields")
+        # Seed through the seed_all RPC (database/migrations/013_seed_all_rpc.sql),
+        # which sorts each batch by primary key. Lessons are built and serialised
+        # one batch at a time; the last batch is held back so the first quiz
+        # batch rides along with it, after every lesson it references exists.
+        # Today everything fits in a single call.
+        print("🌱 Seeding fields, lessons and quiz questions...")
+        fields = [field.model_dump(exclude_none=True) for field in get_seed_fields()]
+        quiz_questions = get_seed_quiz_questions()
+        quiz_batches = [
+            [question.model_dump(exclude_none=True) for question in batch]
+            for batch in _chunked(quiz_questions)
+        ] or [[]]
         
-        # Seed Lessons
-        print("📖 Seeding lessons...")
-        lessons_response = client.table("lessons").upsert(
-            [lesson.dict() for lesson in seed_data["lessons"]]
-        ).execute()
-        print(f"✅ Seeded {len(seed_data['lessons'])} lessons")
+        # seed_all only rewrites rows whose content changed (migration 014),
+        # so re-running against a seeded database writes nothing
+        written = Counter()
+        pending_fields = fields
+        pending_lessons = []
+        lesson_count = 0
+        for batch in _chunked(iter_seed_lessons()):
+            if pending_lessons:
+                written.update(_seed_all(client, pending_fields, pending_lessons, []))
+                pending_fields = []
+            pending_lessons = [lesson.model_dump(exclude_none=True) for lesson in batch]
+            lesson_count += len(batch)
+        written.update(_seed_all(client, pending_fields, pending_lessons, quiz_batches[0]))
+        for quiz_batch in quiz_batches[1:]:
+            written.update(_seed_all(client, [], [], quiz_batch))
         
-        # Seed Quiz Questions
-        print("📝 Seeding quiz questions...")
-        quiz_response = client.table("quiz_questions").upsert(
-            [question.dict() for question in seed_data["quiz_questions"]]
-        ).execute()
-        print(f"✅ Seeded {len(seed_data['quiz_questions'])} quiz questions")
+        print(f"✅ Seeded {len(fields)} fields ({written['fields']} written)")
+        print(f"✅ Seeded {lesson_count} lessons ({written['lessons']} written)")
+        print(f"✅ Seeded {len(quiz_questions)} quiz questions ({written['quiz_questions']} written)")
+        if not any(written.values()):
+            print("ℹ️  Database was already up to date")
         
         print("\n🎉 Database seeding completed successfully!")
         
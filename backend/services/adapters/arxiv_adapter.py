@@ -2,17 +2,41 @@
 arXiv API Adapter
 Fetches scientific research papers from arXiv.org
 """
-import aiohttp
+try:
+    from lxml import etree as ET
+    LXML_AVAILABLE = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    LXML_AVAILABLE = False
+
 import logging
 from typing import List
-from datetime import datetime
-import xml.etree.ElementTree as ET
+from datetime import date, datetime
 
 from ..source_adapter import SourceAdapter
 from ..content_models import NormalizedContent, SourceType
 
 logger = logging.getLogger(__name__)
 
+# Fully-qualified Atom tags, compared directly instead of resolving
+# namespace prefixes on every find()
+_ATOM = "{http://www.w3.org/2005/Atom}"
+_ENTRY = _ATOM + "entry"
+_TITLE = _ATOM + "title"
+_SUMMARY = _ATOM + "summary"
+_PUBLISHED = _ATOM + "published"
+_UPDATED = _ATOM + "updated"
+_ID = _ATOM + "id"
+_AUTHOR = _ATOM + "author"
+_NAME = _ATOM + "name"
+_CATEGORY = _ATOM + "category"
+_LINK = _ATOM + "link"
+_TEXT_TAGS = frozenset((_TITLE, _SUMMARY, _PUBLISHED, _UPDATED, _ID))
+
+# lxml (libxml2) can filter to entry elements itself; never expand entities
+_PULL_PARSER_OPTIONS = {"tag": _ENTRY, "resolve_entities": False} if LXML_AVAILABLE else {}
+_CHUNK_SIZE = 16384
+
 
 class ArxivAdapter(SourceAdapter):
     """
@@ -37,98 +61,97 @@ class ArxivAdapter(SourceAdapter):
         async def _fetch_data():
             results = []
             
-            async with aiohttp.ClientSession() as session:
-                try:
-                    params = {
-                        "search_query": f"all:{topic}",
-                        "start": 0,
-                        "max_results": limit,
-                        "sortBy": "relevance",
-                        "sortOrder": "descending"
-                    }
-                    
-                    async with session.get(
-                        self.BASE_URL,
-                        params=params,
-                        timeout=self.timeout
-                    ) as response:
-                        if response.status != 200:
-                            logger.warning(f"arXiv API returned status {response.status}")
-                            return []
-                        
-                        xml_data = await response.text()
-                        results = self._parse_arxiv_xml(xml_data)
+            session = await self._get_session()
+            try:
+                params = {
+                    "search_query": f"all:{topic}",
+                    "start": 0,
+                    "max_results": limit,
+                    "sortBy": "relevance",
+                    "sortOrder": "descending"
+                }
                 
-                except Exception as e:
-                    logger.warning(f"Failed to fetch from arXiv: {e}")
+                async with session.get(
+                    self.BASE_URL,
+                    params=params,
+                    timeout=self.timeout
+                ) as response:
+                    if response.status != 200:
+                        logger.warning(f"arXiv API returned status {response.status}")
+                        return []
+                    
+                    # Feed the body into the parser as it arrives, never
+                    # holding the whole feed as bytes or str
+                    parser = ET.XMLPullParser(events=("end",), **_PULL_PARSER_OPTIONS)
+                    async for chunk in response.content.iter_chunked(_CHUNK_SIZE):
+                        parser.feed(chunk)
+                        self._read_entries(parser, results)
+                        if len(results) >= limit:
+                            break
+                    else:
+                        parser.close()
+                        self._read_entries(parser, results)
+            
+            except Exception as e:
+                logger.warning(f"Failed to fetch from arXiv: {e}")
             
             return results[:limit]
         
         return await self._retry_request(_fetch_data)
     
-    def _parse_arxiv_xml(self, xml_data: str) -> List[dict]:
-        """Parse arXiv API XML response"""
-        try:
-            root = ET.fromstring(xml_data)
-            
-            # Define namespace
-            ns = {
-                'atom': 'http://www.w3.org/2005/Atom',
-                'arxiv': 'http://arxiv.org/schemas/atom'
-            }
-            
-            results = []
-            for entry in root.findall('atom:entry', ns):
-                # Extract data
-                title = entry.find('atom:title', ns)
-                summary = entry.find('atom:summary', ns)
-                published = entry.find('atom:published', ns)
-                updated = entry.find('atom:updated', ns)
-                id_elem = entry.find('atom:id', ns)
-                
-                # Extract authors
-                authors = []
-                for author in entry.findall('atom:author', ns):
-                    name = author.find('atom:name', ns)
-                    if name is not None:
-                        authors.append(name.text)
-                
-                # Extract categories
-                categories = []
-                for category in entry.findall('atom:category', ns):
-                    term = category.get('term')
-                    if term:
-                        categories.append(term)
-                
-                # Extract PDF link
-                pdf_link = ""
-                for link in entry.findall('atom:link', ns):
-                    if link.get('title') == 'pdf':
-                        pdf_link = link.get('href', '')
-                        break
-                
-                # Get arXiv ID from URL
-                arxiv_id = ""
-                if id_elem is not None:
-                    arxiv_id = id_elem.text.split('/abs/')[-1] if '/abs/' in id_elem.text else ""
-                
-                results.append({
-                    "title": title.text.strip() if title is not None else "",
-                    "summary": summary.text.strip() if summary is not None else "",
-                    "authors": authors,
-                    "published": published.text if published is not None else "",
-                    "updated": updated.text if updated is not None else "",
-                    "arxiv_id": arxiv_id,
-                    "url": id_elem.text if id_elem is not None else "",
-                    "pdf_url": pdf_link,
-                    "categories": categories
-                })
-            
-            return results
+    def _read_entries(self, parser, results: List[dict]):
+        """
+        Extract every entry the pull parser has finished so far.
+        Each entry is cleared once extracted, so only the one being parsed
+        is held in memory.
+        """
+        for _, elem in parser.read_events():
+            if elem.tag != _ENTRY:
+                continue
+            results.append(self._extract_entry(elem))
+            elem.clear()
+    
+    def _extract_entry(self, elem) -> dict:
+        """Build a paper dict from one Atom entry element"""
+        fields = {}
+        authors = []
+        categories = []
+        pdf_link = ""
+        
+        # Single pass over the entry's children
+        for child in elem:
+            tag = child.tag
+            if tag in _TEXT_TAGS:
+                fields[tag] = child.text or ""
+            elif tag == _AUTHOR:
+                # findtext reads the text in one call and gives "" rather
+                # than None for an empty <name/>
+                name = child.findtext(_NAME)
+                if name is not None:
+                    authors.append(name)
+            elif tag == _CATEGORY:
+                term = child.get('term')
+                if term:
+                    categories.append(term)
+            elif tag == _LINK and not pdf_link and child.get('title') == 'pdf':
+                pdf_link = child.get('href', '')
+        
+        id_text = fields.get(_ID, "")
         
-        except Exception as e:
-            logger.error(f"Failed to parse arXiv XML: {e}")
-            return []
+        # Get arXiv ID from URL
+        arxiv_id = id_text.split('/abs/')[-1] if '/abs/' in id_text else ""
+        
+        return {
+            "title": fields.get(_TITLE, "").strip(),
+            "summary": fields.get(_SUMMARY, "").strip(),
+            "authors": authors,
+            "published": fields.get(_PUBLISHED, ""),
+            "updated": fields.get(_UPDATED, ""),
+            "arxiv_id": arxiv_id,
+            "url": id_text,
+            "pdf_url": pdf_link,
+            "categories": categories
+        }
     
     def normalize(self, raw_content: dict) -> NormalizedContent:
         """
@@ -161,10 +184,11 @@ class ArxivAdapter(SourceAdapter):
         
         # Published date
         if published:
+            # Only the calendar date is shown, so parse just YYYY-MM-DD
             try:
-                date_obj = datetime.fromisoformat(published.replace('Z', '+00:00'))
+                date_obj = date.fromisoformat(published[:10])
                 content_parts.append(f"Published: {date_obj.strftime('%B %d, %Y')}")
-            except:
+            except ValueError:
                 content_parts.append(f"Published: {published}")
         
         # arXiv ID
@@ -202,7 +226,3 @@ class ArxivAdapter(SourceAdapter):
             },
             fetched_at=datetime.now()
         )
-    
-    async def close(self):
-        """No persistent client to close for arXiv (uses context manager)"""
-        pass
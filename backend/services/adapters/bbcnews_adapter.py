@@ -3,17 +3,35 @@ BBC News API Adapter
 Fetches latest news articles from BBC
 Note: BBC doesn't have an official public API, so we'll use NewsAPI.org which includes BBC
 """
-import aiohttp
+import asyncio
 import logging
+import orjson
+from itertools import islice
 from typing import List, Optional
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import os
+import time
 
 from ..source_adapter import SourceAdapter
 from ..content_models import NormalizedContent, SourceType
 
 logger = logging.getLogger(__name__)
 
+# "Time ago" labels have minute resolution, so one clock read per second
+# is shared by every article normalized in a page
+_now_cache = (0.0, None)
+
+
+def _cached_utc_now() -> datetime:
+    """Current UTC time, refreshed at most once per second"""
+    global _now_cache
+    checked_at, now = _now_cache
+    mono = time.monotonic()
+    if now is None or mono - checked_at >= 1.0:
+        now = datetime.now(timezone.utc)
+        _now_cache = (mono, now)
+    return now
+
 
 class BBCNewsAdapter(SourceAdapter):
     """
@@ -29,6 +47,18 @@ class BBCNewsAdapter(SourceAdapter):
         self.api_key = api_key or os.getenv("NEWS_API_KEY")
         if not self.api_key:
             logger.warning("NewsAPI key not provided. Set NEWS_API_KEY environment variable.")
+        # NewsAPI free tier allows one request per second
+        self.min_request_interval = 1.0
+        self._last_request_time = 0.0
+        self._rate_lock = asyncio.Semaphore(1)
+    
+    async def _wait_for_rate_limit(self):
+        """Space requests at least min_request_interval apart to avoid HTTP 429"""
+        async with self._rate_lock:
+            wait = self._last_request_time + self.min_request_interval - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._last_request_time = time.monotonic()
     
     async def fetch(self, topic: str, limit: int = 5) -> List[dict]:
         """
@@ -48,48 +78,38 @@ class BBCNewsAdapter(SourceAdapter):
         async def _fetch_data():
             results = []
             
-            async with aiohttp.ClientSession() as session:
-                try:
-                    # Search for articles from BBC
-                    params = {
-                        "q": topic,
-                        "sources": "bbc-news",
-                        "language": "en",
-                        "sortBy": "relevancy",
-                        "pageSize": min(limit, 100),  # API max is 100
-                        "apiKey": self.api_key,
-                    }
-                    
-                    async with session.get(
-                        f"{self.BASE_URL}/everything",
-                        params=params,
-                        timeout=self.timeout
-                    ) as response:
-                        if response.status == 200:
-                            data = await response.json()
-                            articles = data.get("articles", [])
-                            
-                            for article in articles[:limit]:
-                                results.append({
-                                    "title": article.get("title"),
-                                    "description": article.get("description"),
-                                    "content": article.get("content"),
-                                    "url": article.get("url"),
-                                    "image_url": article.get("urlToImage"),
-                                    "published_at": article.get("publishedAt"),
-                                    "author": article.get("author"),
-                                    "source": article.get("source", {}).get("name", "BBC News"),
-                                })
-                        
-                        elif response.status == 401:
-                            logger.error("NewsAPI authentication failed - invalid API key")
-                        elif response.status == 429:
-                            logger.warning("NewsAPI rate limit exceeded")
-                        else:
-                            logger.warning(f"NewsAPI returned status {response.status}")
+            session = await self._get_session()
+            try:
+                # Search for articles from BBC
+                params = {
+                    "q": topic,
+                    "sources": "bbc-news",
+                    "language": "en",
+                    "sortBy": "relevancy",
+                    "pageSize": min(limit, 100),  # API max is 100
+                    "apiKey": self.api_key,
+                }
                 
-                except Exception as e:
-                    logger.warning(f"Failed to fetch from NewsAPI: {e}")
+                await self._wait_for_rate_limit()
+                async with session.get(
+                    f"{self.BASE_URL}/everything",
+                    params=params,
+                    timeout=self.timeout
+                ) as response:
+                    if response.status == 200:
+                        data = orjson.loads(await response.read())
+                        articles = data.get("articles", [])
+                        results = [self._extract_article(a) for a in islice(articles, limit)]
+                    
+                    elif response.status == 401:
+                        logger.error("NewsAPI authentication failed - invalid API key")
+                    elif response.status == 429:
+                        logger.warning("NewsAPI rate limit exceeded")
+                    else:
+                        logger.warning(f"NewsAPI returned status {response.status}")
+            
+            except Exception as e:
+                logger.warning(f"Failed to fetch from NewsAPI: {e}")
             
             return results
         
@@ -113,47 +133,50 @@ class BBCNewsAdapter(SourceAdapter):
         async def _fetch_data():
             results = []
             
-            async with aiohttp.ClientSession() as session:
-                try:
-                    params = {
-                        "sources": "bbc-news",
-                        "pageSize": min(limit, 100),
-                        "apiKey": self.api_key,
-                    }
-                    
-                    if category:
-                        params["category"] = category
-                    
-                    async with session.get(
-                        f"{self.BASE_URL}/top-headlines",
-                        params=params,
-                        timeout=self.timeout
-                    ) as response:
-                        if response.status == 200:
-                            data = await response.json()
-                            articles = data.get("articles", [])
-                            
-                            for article in articles[:limit]:
-                                results.append({
-                                    "title": article.get("title"),
-                                    "description": article.get("description"),
-                                    "content": article.get("content"),
-                                    "url": article.get("url"),
-                                    "image_url": article.get("urlToImage"),
-                                    "published_at": article.get("publishedAt"),
-                                    "author": article.get("author"),
-                                    "source": article.get("source", {}).get("name", "BBC News"),
-                                })
-                        else:
-                            logger.warning(f"NewsAPI top headlines returned status {response.status}")
+            session = await self._get_session()
+            try:
+                params = {
+                    "sources": "bbc-news",
+                    "pageSize": min(limit, 100),
+                    "apiKey": self.api_key,
+                }
                 
-                except Exception as e:
-                    logger.warning(f"Failed to fetch top headlines: {e}")
+                if category:
+                    params["category"] = category
+                
+                await self._wait_for_rate_limit()
+                async with session.get(
+                    f"{self.BASE_URL}/top-headlines",
+                    params=params,
+                    timeout=self.timeout
+                ) as response:
+                    if response.status == 200:
+                        data = orjson.loads(await response.read())
+                        articles = data.get("articles", [])
+                        results = [self._extract_article(a) for a in islice(articles, limit)]
+                    else:
+                        logger.warning(f"NewsAPI top headlines returned status {response.status}")
+            
+            except Exception as e:
+                logger.warning(f"Failed to fetch top headlines: {e}")
             
             return results
         
         return await self._retry_request(_fetch_data)
     
+    def _extract_article(self, article: dict) -> dict:
+        """Map a NewsAPI article onto the keys normalize expects"""
+        return {
+            "title": article.get("title"),
+            "description": article.get("description"),
+            "content": article.get("content"),
+            "url": article.get("url"),
+            "image_url": article.get("urlToImage"),
+            "published_at": article.get("publishedAt"),
+            "author": article.get("author"),
+            "source": article.get("source", {}).get("name", "BBC News"),
+        }
+    
     def normalize(self, raw_content: dict) -> NormalizedContent:
         """
         Normalize BBC News data to standard format.
@@ -184,10 +207,12 @@ class BBCNewsAdapter(SourceAdapter):
         # Published date
         if published_at:
             try:
-                pub_date = datetime.fromisoformat(published_at.replace('Z', '+00:00'))
+                # Python 3.11+ parses the trailing 'Z' directly
+                pub_date = datetime.fromisoformat(published_at)
+                if pub_date.tzinfo is None:
+                    pub_date = pub_date.replace(tzinfo=timezone.utc)
                 # Calculate time ago
-                now = datetime.now(pub_date.tzinfo)
-                time_diff = now - pub_date
+                time_diff = _cached_utc_now() - pub_date
                 
                 if time_diff.days > 0:
                     time_ago = f"{time_diff.days} day{'s' if time_diff.days > 1 else ''} ago"
@@ -10,6 +10,7 @@ except ImportError:
     yf = None
 
 import logging
+import re
 from typing import List, Optional
 from datetime import datetime, timedelta
 import asyncio
@@ -19,6 +20,9 @@ from ..content_models import NormalizedContent, SourceType
 
 logger = logging.getLogger(__name__)
 
+# Plain symbols (TSLA) and currency pairs (BTC-USD)
+_TICKER_PATTERN = re.compile(r"[A-Z]{1,5}(-[A-Z]{3})?")
+
 
 class FinanceAdapter(SourceAdapter):
     """
@@ -37,8 +41,15 @@ class FinanceAdapter(SourceAdapter):
         "energy": ["XOM", "CVX", "COP", "SLB"],
     }
     
-    def __init__(self, **kwargs):
+    def __init__(self, full_info: bool = False, **kwargs):
+        """
+        Args:
+            full_info: Scrape the full .info blob (company name, sector,
+                ratios, business summary) instead of the lightweight
+                fast_info subset
+        """
         super().__init__(**kwargs)
+        self.full_info = full_info
     
     def _get_tickers_for_topic(self, topic: str) -> List[str]:
         """
@@ -52,13 +63,24 @@ class FinanceAdapter(SourceAdapter):
         """
         topic_lower = topic.lower()
         
-        # Check if topic matches a category
-        for category, tickers in self.TOPIC_TICKERS.items():
-            if category in topic_lower or topic_lower in category:
-                return tickers
+        # Exact category name (keys are already lowercase)
+        tickers = self.TOPIC_TICKERS.get(topic_lower)
+        if tickers is not None:
+            return tickers
+        
+        # Fall back to a partial match against the categories
+        tickers = next(
+            (
+                tickers for category, tickers in self.TOPIC_TICKERS.items()
+                if category in topic_lower or topic_lower in category
+            ),
+            None
+        )
+        if tickers is not None:
+            return tickers
         
-        # If topic looks like a ticker symbol, use it directly
-        if len(topic) <= 5 and topic.isupper():
+        # If topic looks like a ticker symbol (e.g. TSLA, BTC-USD), use it directly
+        if _TICKER_PATTERN.fullmatch(topic):
             return [topic]
         
         # Default to major indices
@@ -81,38 +103,108 @@ class FinanceAdapter(SourceAdapter):
         
         async def _fetch_data():
             tickers = self._get_tickers_for_topic(topic)[:limit]
-            results = []
             
-            for ticker_symbol in tickers:
-                try:
-                    # Run yfinance in thread pool (it's synchronous)
-                    ticker = await asyncio.to_thread(yf.Ticker, ticker_symbol)
-                    
-                    # Get basic info
-                    info = await asyncio.to_thread(lambda: ticker.info)
-                    
-                    # Get recent history
-                    hist = await asyncio.to_thread(
-                        lambda: ticker.history(period="5d")
-                    )
-                    
-                    if not hist.empty:
-                        results.append({
-                            "ticker": ticker_symbol,
-                            "info": info,
-                            "history": hist,
-                            "current_price": hist['Close'].iloc[-1] if len(hist) > 0 else None,
-                            "previous_close": hist['Close'].iloc[-2] if len(hist) > 1 else None,
-                        })
-                    
-                except Exception as e:
-                    logger.warning(f"Failed to fetch data for {ticker_symbol}: {e}")
+            # One batched download for all price histories, alongside the
+            # per-ticker info lookups (yfinance has no batch info API)
+            history, infos = await asyncio.gather(
+                self._download_history(tickers),
+                asyncio.gather(*(self._fetch_info(t) for t in tickers))
+            )
+            if history is None:
+                return []
+            
+            results = []
+            for ticker_symbol, info in zip(tickers, infos):
+                hist = self._ticker_history(history, ticker_symbol)
+                if info is None or hist is None or hist.empty:
                     continue
+                
+                closes = hist['Close'].to_numpy()
+                results.append({
+                    "ticker": ticker_symbol,
+                    "info": info,
+                    "history": hist,
+                    "current_price": float(closes[-1]) if closes.size > 0 else None,
+                    "previous_close": float(closes[-2]) if closes.size > 1 else None,
+                })
             
             return results
         
         return await self._retry_request(_fetch_data)
     
+    async def _download_history(self, tickers: List[str]):
+        """
+        Download 5-day price history for all tickers in one batched request.
+        
+        Args:
+            tickers: Ticker symbols
+            
+        Returns:
+            DataFrame grouped by ticker, or None on failure
+        """
+        try:
+            return await asyncio.to_thread(
+                yf.download,
+                tickers,
+                period="5d",
+                group_by="ticker",
+                threads=True,
+                progress=False
+            )
+        except Exception as e:
+            logger.warning(f"Failed to download history for {tickers}: {e}")
+            return None
+    
+    def _ticker_history(self, history, ticker_symbol: str):
+        """
+        Slice one ticker's rows out of a batched download.
+        
+        Args:
+            history: DataFrame returned by yf.download
+            ticker_symbol: Ticker to extract
+            
+        Returns:
+            That ticker's history with empty (NaN close) rows dropped, or None
+        """
+        if history.columns.nlevels > 1:
+            if ticker_symbol not in history.columns.get_level_values(0):
+                return None
+            history = history[ticker_symbol]
+        return history.dropna(subset=['Close'])
+    
+    def _load_info(self, ticker_symbol: str) -> dict:
+        """
+        Blocking yfinance info lookup for one ticker.
+        
+        Without full_info only fast_info is read, keyed like .info so
+        normalize handles both; the remaining fields fall back to defaults.
+        """
+        ticker = yf.Ticker(ticker_symbol)
+        if self.full_info:
+            return ticker.info
+        
+        fast_info = ticker.fast_info
+        return {
+            "marketCap": fast_info.market_cap or 0,
+            "currency": fast_info.currency,
+        }
+    
+    async def _fetch_info(self, ticker_symbol: str) -> Optional[dict]:
+        """
+        Fetch one ticker's info without blocking the event loop.
+        
+        Args:
+            ticker_symbol: Ticker to fetch
+            
+        Returns:
+            Info dict, or None on failure
+        """
+        try:
+            return await asyncio.to_thread(self._load_info, ticker_symbol)
+        except Exception as e:
+            logger.warning(f"Failed to fetch data for {ticker_symbol}: {e}")
+            return None
+    
     def normalize(self, raw_content: dict) -> NormalizedContent:
         """
         Normalize financial data to standard format with human-readable insights.
@@ -128,10 +220,11 @@ class FinanceAdapter(SourceAdapter):
         current_price = raw_content.get("current_price")
         previous_close = raw_content.get("previous_close")
         
-        # Extract key information
-        company_name = info.get("longName", ticker)
-        sector = info.get("sector", "Unknown")
-        industry = info.get("industry", "Unknown")
+        # Extract key information; company name, sector and industry only
+        # come with full .info, fast_info leaves them out
+        company_name = info.get("longName")
+        sector = info.get("sector")
+        industry = info.get("industry")
         market_cap = info.get("marketCap", 0)
         
         # Calculate price change
@@ -158,7 +251,8 @@ class FinanceAdapter(SourceAdapter):
                 )
         
         # Company information
-        content_parts.append(f"Sector: {sector}, Industry: {industry}")
+        if sector or industry:
+            content_parts.append(f"Sector: {sector or 'Unknown'}, Industry: {industry or 'Unknown'}")
         
         # Market cap
         if market_cap > 0:
@@ -182,7 +276,10 @@ class FinanceAdapter(SourceAdapter):
         
         content = "\n".join(content_parts)
         
-        title = f"{company_name} ({ticker}) Financial Overview"
+        if company_name:
+            title = f"{company_name} ({ticker}) Financial Overview"
+        else:
+            title = f"{ticker} Price Overview"
         
         return NormalizedContent(
             source="finance",
@@ -2,7 +2,6 @@
 FRED (Federal Reserve Economic Data) Adapter
 Fetches economic indicators and converts to readable insights
 """
-import aiohttp
 import logging
 from typing import List, Optional
 from datetime import datetime, timedelta
@@ -117,44 +116,44 @@ class FREDAdapter(SourceAdapter):
             series_list = self._get_series_for_topic(topic)[:limit]
             results = []
             
-            async with aiohttp.ClientSession() as session:
-                for series_info in series_list:
-                    try:
-                        series_id = series_info["series_id"]
-                        
-                        # Fetch series observations (last 12 months)
-                        params = {
-                            "series_id": series_id,
-                            "api_key": self.api_key,
-                            "file_type": "json",
-                            "sort_order": "desc",
-                            "limit": 12
-                        }
-                        
-                        async with session.get(
-                            f"{self.BASE_URL}/series/observations",
-                            params=params,
-                            timeout=self.timeout
-                        ) as response:
-                            if response.status == 200:
-                                data = await response.json()
-                                observations = data.get("observations", [])
-                                
-                                if observations:
-                                    results.append({
-                                        "series_id": series_id,
-                                        "name": series_info["name"],
-                                        "description": series_info["description"],
-                                        "observations": observations,
-                                        "latest_value": observations[0]["value"] if observations else None,
-                                        "latest_date": observations[0]["date"] if observations else None,
-                                    })
-                            else:
-                                logger.warning(f"FRED API returned status {response.status} for {series_id}")
+            session = await self._get_session()
+            for series_info in series_list:
+                try:
+                    series_id = series_info["series_id"]
                     
-                    except Exception as e:
-                        logger.warning(f"Failed to fetch FRED series {series_info['series_id']}: {e}")
-                        continue
+                    # Fetch series observations (last 12 months)
+                    params = {
+                        "series_id": series_id,
+                        "api_key": self.api_key,
+                        "file_type": "json",
+                        "sort_order": "desc",
+                        "limit": 12
+                    }
+                    
+                    async with session.get(
+                        f"{self.BASE_URL}/series/observations",
+                        params=params,
+                        timeout=self.timeout
+                    ) as response:
+                        if response.status == 200:
+                            data = await response.json()
+                            observations = data.get("observations", [])
+                            
+                            if observations:
+                                results.append({
+                                    "series_id": series_id,
+                                    "name": series_info["name"],
+                                    "description": series_info["description"],
+                                    "observations": observations,
+                                    "latest_value": observations[0]["value"] if observations else None,
+                                    "latest_date": observations[0]["date"] if observations else None,
+                                })
+                        else:
+                            logger.warning(f"FRED API returned status {response.status} for {series_id}")
+                
+                except Exception as e:
+                    logger.warning(f"Failed to fetch FRED series {series_info['series_id']}: {e}")
+                    continue
             
             return results
         
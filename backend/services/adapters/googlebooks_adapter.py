@@ -2,7 +2,6 @@
 Google Books API Adapter
 Fetches book excerpts and information
 """
-import aiohttp
 import logging
 from typing import List, Optional
 from datetime import datetime
@@ -52,47 +51,47 @@ class GoogleBooksAdapter(SourceAdapter):
             if self.api_key:
                 params["key"] = self.api_key
             
-            async with aiohttp.ClientSession() as session:
-                try:
-                    async with session.get(
-                        self.BASE_URL,
-                        params=params,
-                        timeout=self.timeout
-                    ) as response:
-                        if response.status == 200:
-                            data = await response.json()
-                            items = data.get("items", [])
-                            
-                            for item in items[:limit]:
-                                volume_info = item.get("volumeInfo", {})
-                                
-                                # Extract relevant information
-                                book_data = {
-                                    "id": item.get("id"),
-                                    "title": volume_info.get("title"),
-                                    "authors": volume_info.get("authors", []),
-                                    "publisher": volume_info.get("publisher"),
-                                    "published_date": volume_info.get("publishedDate"),
-                                    "description": volume_info.get("description"),
-                                    "page_count": volume_info.get("pageCount"),
-                                    "categories": volume_info.get("categories", []),
-                                    "language": volume_info.get("language"),
-                                    "preview_link": volume_info.get("previewLink"),
-                                    "info_link": volume_info.get("infoLink"),
-                                    "thumbnail": volume_info.get("imageLinks", {}).get("thumbnail"),
-                                    "average_rating": volume_info.get("averageRating"),
-                                    "ratings_count": volume_info.get("ratingsCount"),
-                                }
-                                
-                                results.append(book_data)
+            session = await self._get_session()
+            try:
+                async with session.get(
+                    self.BASE_URL,
+                    params=params,
+                    timeout=self.timeout
+                ) as response:
+                    if response.status == 200:
+                        data = await response.json()
+                        items = data.get("items", [])
                         
-                        elif response.status == 403:
-                            logger.warning("Google Books API quota exceeded or invalid API key")
-                        else:
-                            logger.warning(f"Google Books API returned status {response.status}")
-                
-                except Exception as e:
-                    logger.warning(f"Failed to fetch from Google Books: {e}")
+                        for item in items[:limit]:
+                            volume_info = item.get("volumeInfo", {})
+                            
+                            # Extract relevant information
+                            book_data = {
+                                "id": item.get("id"),
+                                "title": volume_info.get("title"),
+                                "authors": volume_info.get("authors", []),
+                                "publisher": volume_info.get("publisher"),
+                                "published_date": volume_info.get("publishedDate"),
+                                "description": volume_info.get("description"),
+                                "page_count": volume_info.get("pageCount"),
+                                "categories": volume_info.get("categories", []),
+                                "language": volume_info.get("language"),
+                                "preview_link": volume_info.get("previewLink"),
+                                "info_link": volume_info.get("infoLink"),
+                                "thumbnail": volume_info.get("imageLinks", {}).get("thumbnail"),
+                                "average_rating": volume_info.get("averageRating"),
+                                "ratings_count": volume_info.get("ratingsCount"),
+                            }
+                            
+                            results.append(book_data)
+                    
+                    elif response.status == 403:
+                        logger.warning("Google Books API quota exceeded or invalid API key")
+                    else:
+                        logger.warning(f"Google Books API returned status {response.status}")
+            
+            except Exception as e:
+                logger.warning(f"Failed to fetch from Google Books: {e}")
             
             return results
         
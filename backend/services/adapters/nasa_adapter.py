@@ -41,29 +41,29 @@ class NASAAdapter(SourceAdapter):
         async def _fetch_data():
             results = []
             
-            async with aiohttp.ClientSession() as session:
-                try:
-                    # Fetch from multiple NASA endpoints
-                    
-                    # 1. NASA Image and Video Library
-                    search_results = await self._search_media_library(
-                        session, topic, limit=min(limit, 3)
-                    )
-                    results.extend(search_results)
-                    
-                    # 2. Astronomy Picture of the Day (if space-related)
-                    if any(word in topic.lower() for word in ["space", "astronomy", "planet", "star", "galaxy"]):
-                        apod = await self._fetch_apod(session)
-                        if apod:
-                            results.append(apod)
-                    
-                    # 3. Mars Rover Photos (if Mars-related)
-                    if "mars" in topic.lower():
-                        mars_photos = await self._fetch_mars_photos(session, limit=2)
-                        results.extend(mars_photos)
+            session = await self._get_session()
+            try:
+                # Fetch from multiple NASA endpoints
                 
-                except Exception as e:
-                    logger.warning(f"Failed to fetch from NASA: {e}")
+                # 1. NASA Image and Video Library
+                search_results = await self._search_media_library(
+                    session, topic, limit=min(limit, 3)
+                )
+                results.extend(search_results)
+                
+                # 2. Astronomy Picture of the Day (if space-related)
+                if any(word in topic.lower() for word in ["space", "astronomy", "planet", "star", "galaxy"]):
+                    apod = await self._fetch_apod(session)
+                    if apod:
+                        results.append(apod)
+                
+                # 3. Mars Rover Photos (if Mars-related)
+                if "mars" in topic.lower():
+                    mars_photos = await self._fetch_mars_photos(session, limit=2)
+                    results.extend(mars_photos)
+            
+            except Exception as e:
+                logger.warning(f"Failed to fetch from NASA: {e}")
             
             return results[:limit]
         
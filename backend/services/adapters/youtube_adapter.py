@@ -48,77 +48,77 @@ class YouTubeAdapter(SourceAdapter):
         async def _fetch_data():
             results = []
             
-            async with aiohttp.ClientSession() as session:
-                try:
-                    # Search for videos
-                    search_params = {
-                        "part": "snippet",
-                        "q": topic,
-                        "type": "video",
-                        "maxResults": min(limit, 50),
-                        "order": "relevance",
+            session = await self._get_session()
+            try:
+                # Search for videos
+                search_params = {
+                    "part": "snippet",
+                    "q": topic,
+                    "type": "video",
+                    "maxResults": min(limit, 50),
+                    "order": "relevance",
+                    "key": self.api_key,
+                    "videoCaption": "closedCaption",  # Prefer videos with captions
+                }
+                
+                async with session.get(
+                    f"{self.BASE_URL}/search",
+                    params=search_params,
+                    timeout=self.timeout
+                ) as response:
+                    if response.status != 200:
+                        logger.warning(f"YouTube search API returned status {response.status}")
+                        return []
+                    
+                    search_data = await response.json()
+                    video_ids = [item["id"]["videoId"] for item in search_data.get("items", [])]
+                    
+                    if not video_ids:
+                        return []
+                    
+                    # Get detailed video information
+                    video_params = {
+                        "part": "snippet,contentDetails,statistics",
+                        "id": ",".join(video_ids),
                         "key": self.api_key,
-                        "videoCaption": "closedCaption",  # Prefer videos with captions
                     }
                     
                     async with session.get(
-                        f"{self.BASE_URL}/search",
-                        params=search_params,
+                        f"{self.BASE_URL}/videos",
+                        params=video_params,
                         timeout=self.timeout
-                    ) as response:
-                        if response.status != 200:
-                            logger.warning(f"YouTube search API returned status {response.status}")
+                    ) as video_response:
+                        if video_response.status != 200:
+                            logger.warning(f"YouTube videos API returned status {video_response.status}")
                             return []
                         
-                        search_data = await response.json()
-                        video_ids = [item["id"]["videoId"] for item in search_data.get("items", [])]
+                        video_data = await video_response.json()
                         
-                        if not video_ids:
-                            return []
-                        
-                        # Get detailed video information
-                        video_params = {
-                            "part": "snippet,contentDetails,statistics",
-                            "id": ",".join(video_ids),
-                            "key": self.api_key,
-                        }
-                        
-                        async with session.get(
-                            f"{self.BASE_URL}/videos",
-                            params=video_params,
-                            timeout=self.timeout
-                        ) as video_response:
-                            if video_response.status != 200:
-                                logger.warning(f"YouTube videos API returned status {video_response.status}")
-                                return []
+                        for item in video_data.get("items", []):
+                            video_id = item["id"]
+                            snippet = item.get("snippet", {})
+                            statistics = item.get("statistics", {})
+                            content_details = item.get("contentDetails", {})
                             
-                            video_data = await video_response.json()
+                            # Try to get captions
+                            caption_text = await self._fetch_captions(session, video_id)
                             
-                            for item in video_data.get("items", []):
-                                video_id = item["id"]
-                                snippet = item.get("snippet", {})
-                                statistics = item.get("statistics", {})
-                                content_details = item.get("contentDetails", {})
-                                
-                                # Try to get captions
-                                caption_text = await self._fetch_captions(session, video_id)
-                                
-                                results.append({
-                                    "video_id": video_id,
-                                    "title": snippet.get("title"),
-                                    "description": snippet.get("description"),
-                                    "channel_title": snippet.get("channelTitle"),
-                                    "published_at": snippet.get("publishedAt"),
-                                    "thumbnail": snippet.get("thumbnails", {}).get("high", {}).get("url"),
-                                    "duration": content_details.get("duration"),
-                                    "view_count": statistics.get("viewCount"),
-                                    "like_count": statistics.get("likeCount"),
-                                    "comment_count": statistics.get("commentCount"),
-                                    "caption_text": caption_text,
-                                })
-                
-                except Exception as e:
-                    logger.warning(f"Failed to fetch from YouTube: {e}")
+                            results.append({
+                                "video_id": video_id,
+                                "title": snippet.get("title"),
+                                "description": snippet.get("description"),
+                                "channel_title": snippet.get("channelTitle"),
+                                "published_at": snippet.get("publishedAt"),
+                                "thumbnail": snippet.get("thumbnails", {}).get("high", {}).get("url"),
+                                "duration": content_details.get("duration"),
+                                "view_count": statistics.get("viewCount"),
+                                "like_count": statistics.get("likeCount"),
+                                "comment_count": statistics.get("commentCount"),
+                                "caption_text": caption_text,
+                            })
+            
+            except Exception as e:
+                logger.warning(f"Failed to fetch from YouTube: {e}")
             
             return results
         
@@ -6,7 +6,7 @@ import asyncio
 import logging
 import os
 from datetime import datetime, timedelta
-from typing import List, Dict
+from typing import AsyncIterator, List, Dict
 import uuid
 
 from services.free_llm_service import get_free_llm_service
@@ -19,10 +19,13 @@ from services.source_adapter import SourceAdapter
 from services.adapters.reddit_adapter import RedditAdapter
 from services.adapters.hackernews_adapter import HackerNewsAdapter
 from services.adapters.rss_adapter import RSSAdapter
-from database import db
+from database import db, quiz_row_id
 
 logger = logging.getLogger(__name__)
 
+# Fields generated at the same time during the daily run
+MAX_CONCURRENT_FIELDS = 3
+
 
 class AutoContentGenerator:
     """
@@ -85,20 +88,45 @@ class AutoContentGenerator:
         Main method to generate daily content for all fields.
         Should be called once per day (e.g., via cron job).
         """
+        return [lesson async for lesson in self.stream_daily_content()]
+    
+    async def stream_daily_content(self) -> AsyncIterator[Dict]:
+        """
+        Generate daily content for all fields, yielding each lesson as soon as
+        its field finishes so callers that only count or forward lessons
+        don't hold the whole day's output.
+        """
         logger.info("Starting daily content generation...")
         
-        generated_lessons = []
+        # Fields are independent; run a few at a time instead of one after another
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_FIELDS)
         
-        for field_id, target_count in self.daily_targets.items():
-            try:
-                lessons = await self.generate_lessons_for_field(field_id, target_count)
-                generated_lessons.extend(lessons)
-                logger.info(f"Generated {len(lessons)} lessons for {field_id}")
-            except Exception as e:
-                logger.error(f"Failed to generate lessons for {field_id}: {e}")
+        async def generate_field(field_id: str, target_count: int) -> List[Dict]:
+            async with semaphore:
+                try:
+                    lessons = await self.generate_lessons_for_field(field_id, target_count)
+                    logger.info(f"Generated {len(lessons)} lessons for {field_id}")
+                    return lessons
+                except Exception as e:
+                    logger.error(f"Failed to generate lessons for {field_id}: {e}")
+                    return []
+        
+        tasks = [
+            asyncio.ensure_future(generate_field(field_id, target_count))
+            for field_id, target_count in self.daily_targets.items()
+        ]
+        total = 0
+        try:
+            for finished in asyncio.as_completed(tasks):
+                for lesson in await finished:
+                    total += 1
+                    yield lesson
+        finally:
+            # Consumer stopped early (or failed): don't leave fields running
+            for task in tasks:
+                task.cancel()
         
-        logger.info(f"Daily content generation complete. Total: {len(generated_lessons)} lessons")
-        return generated_lessons
+        logger.info(f"Daily content generation complete. Total: {total} lessons")
     
     async def generate_lessons_for_field(self, field_id: str, count: int = 1) -> List[Dict]:
         """
@@ -141,11 +169,11 @@ class AutoContentGenerator:
                 if lesson:
                     lessons.append(lesson)
                     
-                    # Generate quiz for the lesson
-                    await self.generate_quiz_for_lesson(lesson)
-                    
-                    # Generate flashcards for the lesson
-                    await self.generate_flashcards_for_lesson(lesson)
+                    # Quiz and flashcards only depend on the stored lesson
+                    await asyncio.gather(
+                        self.generate_quiz_for_lesson(lesson),
+                        self.generate_flashcards_for_lesson(lesson)
+                    )
                     
             except Exception as e:
                 logger.error(f"Failed to generate lesson {i+1} for {field_id}: {e}")
@@ -459,7 +487,8 @@ class AutoContentGenerator:
             
             if questions:
                 
-                # Store quiz questions
+                # Store quiz questions in one batched insert
+                quiz_rows = []
                 for question in questions:
                     options = question.get('options', [])
                     correct_answer_raw = question.get('correct_answer', '')
@@ -489,8 +518,8 @@ class AutoContentGenerator:
                                     correct_answer_idx = i
                                     break
                     
-                    quiz_data = {
-                        'id': str(uuid.uuid4()),
+                    quiz_rows.append({
+                        'id': quiz_row_id(lesson['id'], question.get('question')),
                         'lesson_id': lesson['id'],
                         'question': question.get('question'),
                         'options': options,
@@ -498,8 +527,9 @@ class AutoContentGenerator:
                         'explanation': question.get('explanation'),
                         'points': 5,
                         'created_at': datetime.now().isoformat()
-                    }
-                    db.client.table('quizzes').insert(quiz_data).execute()
+                    })
+                unique_rows = list({row['id']: row for row in quiz_rows}.values())
+                db.client.table('quizzes').upsert(unique_rows, on_conflict='id').execute()
                 
                 logger.info(f"Generated {len(questions)} quiz questions for lesson {lesson['id']}")
                 
@@ -515,8 +545,8 @@ class AutoContentGenerator:
             )
             
             if flashcards:
-                for card in flashcards:
-                    flashcard_data = {
+                flashcard_rows = [
+                    {
                         'id': str(uuid.uuid4()),
                         'lesson_id': lesson['id'],
                         'field_id': lesson['field_id'],
@@ -526,7 +556,9 @@ class AutoContentGenerator:
                         'difficulty': card.get('difficulty', 'medium'),
                         'created_at': datetime.now().isoformat()
                     }
-                    db.client.table('flashcards').insert(flashcard_data).execute()
+                    for card in flashcards
+                ]
+                db.client.table('flashcards').insert(flashcard_rows).execute()
                 
                 logger.info(f"Generated {len(flashcards)} flashcards for lesson {lesson['id']}")
                 
@@ -543,6 +575,10 @@ class AutoContentGenerator:
         import asyncio
         max_retries = 5  # Increased from 3 to 5
         
+        # lessons.difficulty_level is stored lowercase (CHECK difficulty_lower)
+        if isinstance(lesson.get('difficulty_level'), str):
+            lesson['difficulty_level'] = lesson['difficulty_level'].lower()
+        
         for attempt in range(max_retries):
             try:
                 # Use upsert to handle duplicate keys (update if exists)
@@ -643,9 +679,12 @@ class AutoContentGenerator:
         try:
             cutoff_date = datetime.now() - timedelta(days=days_old)
             
-            response = db.client.table('lessons').delete().match({
-                'is_auto_generated': True
-            }).lt('created_at', cutoff_date.isoformat()).execute()
+            # Sync client call; run it off the loop so it can overlap generation
+            response = await asyncio.to_thread(
+                db.client.table('lessons').delete().match({
+                    'is_auto_generated': True
+                }).lt('created_at', cutoff_date.isoformat()).execute
+            )
             
             logger.info(f"Cleaned up old auto-generated lessons")
             
@@ -41,6 +41,10 @@ class CacheService:
         "bbc_news": 900,         # 15 minutes (news updates frequently)
         "wikipedia": 21600,      # 6 hours
         "rss": 1800,             # 30 minutes
+        "arxiv": 3600,           # 1 hour (paper abstracts don't change)
+        "fields": 3600,          # 1 hour (categories rarely change)
+        "lessons": 60,           # 1 minute (lesson listings)
+        "daily_challenge": 86400,  # 24 hours (keyed by date)
     }
     
     def __init__(self):
@@ -74,6 +74,9 @@ class ContentOrchestrator:
             "arxiv": ArxivAdapter(),
         }
         self.cache = get_cache()
+        # In-flight fetches keyed by (adapter, topic, limit), so concurrent
+        # cache misses for the same request share one upstream call
+        self._inflight: Dict[tuple, asyncio.Future] = {}
         self.use_intelligent_selection = True  # Toggle for intelligent API selection
     
     def _get_adapters_for_field(self, field: str) -> List[str]:
@@ -244,9 +247,20 @@ class ContentOrchestrator:
                 logger.info(f"Cache HIT for {adapter_name}:{topic}")
                 return cached_content
         
-        # Cache miss - fetch from adapter
-        logger.info(f"Cache MISS for {adapter_name}:{topic} - fetching from API")
-        content = await adapter.fetch_and_normalize(topic, limit=limit)
+        # Cache miss - fetch from adapter, joining an identical fetch if one
+        # is already running
+        key = (adapter_name, topic, limit)
+        task = self._inflight.get(key)
+        if task is None:
+            logger.info(f"Cache MISS for {adapter_name}:{topic} - fetching from API")
+            task = asyncio.ensure_future(adapter.fetch_and_normalize(topic, limit=limit))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            logger.info(f"Cache MISS for {adapter_name}:{topic} - joining in-flight fetch")
+        
+        # Shielded so one cancelled caller doesn't cancel the shared fetch
+        content = await asyncio.shield(task)
         
         # Store in cache
         if use_cache and content:
@@ -473,3 +487,15 @@ class ContentOrchestrator:
                 await adapter.close()
             except Exception as e:
                 logger.warning(f"Failed to close adapter: {e}")
+
+
+# Global orchestrator instance
+_orchestrator = None
+
+
+def get_content_orchestrator() -> ContentOrchestrator:
+    """Get or create global content orchestrator instance"""
+    global _orchestrator
+    if _orchestrator is None:
+        _orchestrator = ContentOrchestrator()
+    return _orchestrator
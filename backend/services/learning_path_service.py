@@ -4,12 +4,12 @@ Manages curated learning paths and their lessons
 """
 import logging
 import uuid
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Callable, Awaitable
 from datetime import datetime
 
 from database import db
 from agents.learning_path_agent import LearningPathAgent
-from services.content_orchestrator import ContentOrchestrator
+from services.content_orchestrator import get_content_orchestrator
 
 logger = logging.getLogger(__name__)
 
@@ -18,7 +18,7 @@ class LearningPathService:
     
     def __init__(self):
         self.agent = LearningPathAgent()
-        self.orchestrator = ContentOrchestrator()
+        self.orchestrator = get_content_orchestrator()
     
     async def get_paths_for_field(self, field_id: str) -> List[Dict[str, Any]]:
         """
@@ -57,16 +57,31 @@ class LearningPathService:
             logger.error(f"Error fetching paths for field {field_id}: {e}")
             return []
     
-    async def generate_and_save_paths(self, field_id: str, field_name: str, lessons_per_path: int = 5) -> List[Dict[str, Any]]:
+    async def generate_and_save_paths(
+        self,
+        field_id: str,
+        field_name: str,
+        lessons_per_path: int = 5,
+        content_generator: Optional[Callable[[Dict[str, Any]], Awaitable[Optional[Dict[str, Any]]]]] = None
+    ) -> List[Dict[str, Any]]:
         """
         Generate new learning paths for a field and save to database.
         This creates the path structure and lesson outlines.
+        
+        If content_generator is given, it is awaited with each lesson
+        record before saving and any fields it returns (content, media,
+        etc.) are merged in, so each path's lessons are written once
+        with full content instead of inserted and then updated. Paths that
+        already exist are returned as-is, after content_generator fills any
+        of their lessons still holding only an outline.
         """
         try:
             # Check if paths already exist
             existing = await self.get_paths_for_field(field_id)
             if existing:
                 logger.info(f"Paths already exist for {field_id}")
+                if content_generator:
+                    await self._fill_missing_content(existing, content_generator)
                 return existing
             
             logger.info(f"Generating curriculum for {field_name}...")
@@ -113,13 +128,23 @@ class LearningPathService:
                         'key_concepts': lesson_data.get('key_concepts', [])
                     }
                     
-                    db.client.table("path_lessons").insert(lesson_record).execute()
+                    if content_generator:
+                        try:
+                            content = await content_generator(lesson_record)
+                            if content:
+                                lesson_record.update(content)
+                        except Exception as e:
+                            logger.warning(f"Content generation failed for {lesson_record['title']}: {e}")
+                    
                     lessons.append(lesson_record)
                 
-                saved_paths.append({
-                    **path_record,
-                    'lessons': lessons
-                })
+                # One insert for all of the path's lessons
+                if lessons:
+                    db.client.table("path_lessons").insert(lessons).execute()
+                
+                # Hand back the plain records that were inserted; no copy
+                path_record['lessons'] = lessons
+                saved_paths.append(path_record)
                 
                 logger.info(f"✅ Saved {path_data['name']} with {len(lessons)} lessons")
             
@@ -129,6 +154,36 @@ class LearningPathService:
             logger.error(f"Error generating/saving paths: {e}")
             return []
     
+    async def _fill_missing_content(
+        self,
+        paths: List[Dict[str, Any]],
+        content_generator: Callable[[Dict[str, Any]], Awaitable[Optional[Dict[str, Any]]]]
+    ):
+        """
+        Generate content for saved path lessons that still only have their
+        outline (content empty or just the summary) and upsert them.
+        """
+        for path in paths:
+            filled = []
+            for lesson in path.get('lessons', []):
+                if lesson.get('content') and lesson.get('content') != lesson.get('summary'):
+                    continue
+                
+                try:
+                    content = await content_generator(lesson)
+                except Exception as e:
+                    logger.warning(f"Content generation failed for {lesson['title']}: {e}")
+                    continue
+                
+                if content:
+                    lesson.update(content)
+                    filled.append(lesson)
+            
+            # One upsert for the path's newly filled lessons
+            if filled:
+                db.client.table("path_lessons").upsert(filled, on_conflict="id").execute()
+                logger.info(f"✅ Filled content for {len(filled)} lessons in {path['name']}")
+    
     async def generate_lesson_content(self, path_lesson_id: str) -> bool:
         """
         Generate full content for a path lesson using the content orchestrator.
@@ -0,0 +1,62 @@
+"""
+Event Loop Watchdog
+Logs event-loop stalls and blocking time.sleep calls in async batch scripts
+"""
+import asyncio
+import logging
+import sys
+
+logger = logging.getLogger(__name__)
+
+_audit_hook_installed = False
+
+
+def _warn_on_blocking_sleep(event: str, args: tuple):
+    """Audit hook: flag time.sleep called from a thread running an event loop"""
+    if event != "time.sleep":
+        return
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return  # Worker threads (asyncio.to_thread) may sleep freely
+    logger.warning(f"Blocking time.sleep({args[0]}) called inside the event loop")
+
+
+async def watch_event_loop(interval: float = 0.1, threshold: float = 0.05):
+    """
+    Periodically wake up and log whenever the loop was late by more than threshold.
+
+    Args:
+        interval: Seconds between checks
+        threshold: Lag in seconds that counts as a stall
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        expected = loop.time() + interval
+        await asyncio.sleep(interval)
+        lag = loop.time() - expected
+        if lag > threshold:
+            logger.warning(f"Event loop stalled for {lag * 1000:.0f}ms")
+
+
+def start_loop_watchdog(interval: float = 0.1, threshold: float = 0.05) -> asyncio.Task:
+    """
+    Start the stall watchdog on the running loop.
+    On Python 3.13+ (which raises a time.sleep audit event) also installs,
+    once per process, an audit hook that reports blocking time.sleep calls.
+    Cancel the returned task when the script finishes.
+    """
+    global _audit_hook_installed
+    if not _audit_hook_installed and sys.version_info >= (3, 13):
+        sys.addaudithook(_warn_on_blocking_sleep)
+        _audit_hook_installed = True
+    return asyncio.create_task(watch_event_loop(interval, threshold))
+
+
+async def run_with_watchdog(coro):
+    """Await a script's main coroutine with the stall watchdog running"""
+    watchdog = start_loop_watchdog()
+    try:
+        return await coro
+    finally:
+        watchdog.cancel()
@@ -2,13 +2,32 @@
 Progress tracking service for user learning progress and stats.
 """
 import logging
-from datetime import datetime, date, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
 from typing import Dict, List, Optional, Any
+from postgrest.exceptions import APIError
 from supabase import Client
 import os
+import uuid
 
 logger = logging.getLogger(__name__)
 
+# SQLSTATE the complete_lesson RPC raises for a missing lesson (no_data_found)
+_LESSON_NOT_FOUND_CODE = "P0002"
+
+def is_valid_uuid(value: str) -> bool:
+    """Whether value parses as a UUID (user and lesson ids are UUID columns)"""
+    try:
+        uuid.UUID(value)
+        return True
+    except (TypeError, ValueError, AttributeError):
+        return False
+
+
+# Runs independent Supabase reads of one request side by side; the client is
+# synchronous, so each query otherwise waits for the previous round-trip
+_query_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="progress")
+
 
 class ProgressService:
     """Service for tracking user progress and statistics."""
@@ -82,13 +101,17 @@ class ProgressService:
     def get_user_progress(self, user_id: str) -> Dict[str, Any]:
         """Get detailed user progress including field breakdown."""
         try:
-            # Get user stats
-            stats = self.get_user_stats(user_id)
-            
-            # Get progress by field
-            progress_response = self.client.table("user_progress").select(
+            # Stats, per-field progress and recent quizzes are fetched concurrently
+            stats_future = _query_pool.submit(self.get_user_stats, user_id)
+            progress_future = _query_pool.submit(self.client.table("user_progress").select(
                 "*, lessons(field_id, field_name, category_id, categories(name))"
-            ).eq("user_id", user_id).eq("completed", True).execute()
+            ).eq("user_id", user_id).eq("completed", True).execute)
+            quiz_future = _query_pool.submit(self.client.table("quiz_attempts").select(
+                "*, quizzes(lesson_id), lessons(title)"
+            ).eq("user_id", user_id).order("attempted_at", desc=True).limit(10).execute)
+            
+            stats = stats_future.result()
+            progress_response = progress_future.result()
             
             # Aggregate by field
             field_progress = {}
@@ -111,9 +134,7 @@ class ProgressService:
                 field_progress[field_id]["total_time_minutes"] += record.get("time_spent_seconds", 0) // 60
             
             # Get recent quiz scores
-            quiz_response = self.client.table("quiz_attempts").select(
-                "*, quizzes(lesson_id), lessons(title)"
-            ).eq("user_id", user_id).order("attempted_at", desc=True).limit(10).execute()
+            quiz_response = quiz_future.result()
             
             quiz_scores = []
             for attempt in quiz_response.data:
@@ -148,127 +169,66 @@ class ProgressService:
             }
     
     def complete_lesson(self, user_id: str, lesson_id: str, time_spent_seconds: int = 300) -> Dict[str, Any]:
-        """Mark a lesson as completed and update stats."""
+        """
+        Mark a lesson as completed and update stats.
+        Runs the complete_lesson RPC (migration 006) so the progress upsert and
+        stats update happen atomically in one round-trip.
+        
+        Raises:
+            ValueError: If the lesson does not exist or its id is not a UUID
+        """
+        # A non-UUID id can't match any lesson; checked here so the RPC's
+        # cast error (which it also raises for a bad user id) isn't needed
+        if not is_valid_uuid(lesson_id):
+            raise ValueError(f"Lesson {lesson_id} not found")
+        
         try:
-            # Get lesson details
-            lesson_response = self.client.table("lessons").select("*").eq("id", lesson_id).execute()
-            if not lesson_response.data:
-                raise ValueError(f"Lesson {lesson_id} not found")
+            response = self.client.rpc("complete_lesson", {
+                "p_user": user_id,
+                "p_lesson": lesson_id,
+                "p_time_spent_seconds": time_spent_seconds,
+            }).execute()
+            result = response.data
+            if not isinstance(result, dict):
+                raise RuntimeError(f"complete_lesson returned no result for lesson {lesson_id}")
             
-            lesson = lesson_response.data[0]
-            points = lesson.get("points", 10)
-            
-            # Check if already completed
-            existing = self.client.table("user_progress").select("*").eq(
-                "user_id", user_id
-            ).eq("lesson_id", lesson_id).execute()
-            
-            if existing.data and existing.data[0].get("completed"):
+            if result.get("status") == "already_completed":
                 logger.info(f"Lesson {lesson_id} already completed by user {user_id}")
-                return {"status": "already_completed", "points_earned": 0}
-            
-            # Create or update progress record
-            progress_data = {
-                "user_id": user_id,
-                "lesson_id": lesson_id,
-                "category_id": lesson.get("category_id"),
-                "completed": True,
-                "points_earned": points,
-                "time_spent_seconds": time_spent_seconds,
-                "completed_at": datetime.now().isoformat(),
-            }
-            
-            if existing.data:
-                self.client.table("user_progress").update(progress_data).eq(
-                    "id", existing.data[0]["id"]
-                ).execute()
             else:
-                self.client.table("user_progress").insert(progress_data).execute()
-            
-            # Update user stats
-            self._update_user_stats(user_id, points, time_spent_seconds)
+                logger.info(f"Lesson {lesson_id} completed by user {user_id}, earned {result.get('points_earned')} points")
             
-            logger.info(f"Lesson {lesson_id} completed by user {user_id}, earned {points} points")
-            
-            return {
-                "status": "completed",
-                "points_earned": points,
-                "lesson_id": lesson_id,
-            }
+            return result
         
-        except Exception as e:
+        except APIError as e:
+            if e.code == _LESSON_NOT_FOUND_CODE:
+                raise ValueError(f"Lesson {lesson_id} not found") from e
             logger.error(f"Error completing lesson: {e}")
             raise
-    
-    def _update_user_stats(self, user_id: str, points_earned: int, time_spent_seconds: int):
-        """Update user statistics after completing a lesson."""
-        try:
-            stats = self.get_user_stats(user_id)
-            
-            # Calculate streak
-            last_activity = stats.get("last_activity_date")
-            today = date.today()
-            current_streak = stats.get("current_streak", 0)
-            
-            if last_activity:
-                last_date = datetime.fromisoformat(str(last_activity)).date() if isinstance(last_activity, str) else last_activity
-                days_diff = (today - last_date).days
-                
-                if days_diff == 0:
-                    # Same day, keep streak
-                    pass
-                elif days_diff == 1:
-                    # Consecutive day, increment streak
-                    current_streak += 1
-                else:
-                    # Streak broken, reset to 1
-                    current_streak = 1
-            else:
-                # First activity
-                current_streak = 1
-            
-            # Update stats
-            updated_stats = {
-                "total_points": stats.get("total_points", 0) + points_earned,
-                "lessons_completed": stats.get("lessons_completed", 0) + 1,
-                "current_streak": current_streak,
-                "longest_streak": max(stats.get("longest_streak", 0), current_streak),
-                "total_study_time_minutes": stats.get("total_study_time_minutes", 0) + (time_spent_seconds // 60),
-                "last_activity_date": today.isoformat(),
-                "updated_at": datetime.now().isoformat(),
-            }
-            
-            self.client.table("user_stats").update(updated_stats).eq("user_id", user_id).execute()
-            
         except Exception as e:
-            logger.error(f"Error updating user stats: {e}")
+            logger.error(f"Error completing lesson: {e}")
+            raise
     
     def get_daily_challenge_progress(self, user_id: str) -> Dict[str, Any]:
         """Get user's progress on today's daily challenge."""
         try:
             today = date.today()
             
-            # Get today's completed lessons
-            completed_today = self.client.table("user_progress").select("*").eq(
+            # The three activity queries are independent; run them concurrently
+            completed_future = _query_pool.submit(self.client.table("user_progress").select("*").eq(
                 "user_id", user_id
             ).eq("completed", True).gte(
                 "completed_at", today.isoformat()
-            ).execute()
-            
-            lessons_today = len(completed_today.data)
-            
-            # Get today's quiz attempts
-            quiz_today = self.client.table("quiz_attempts").select("*").eq(
+            ).execute)
+            quiz_future = _query_pool.submit(self.client.table("quiz_attempts").select("*").eq(
                 "user_id", user_id
-            ).gte("attempted_at", today.isoformat()).execute()
-            
-            quizzes_today = len(quiz_today.data)
-            
-            # Get today's reflections
-            reflection_response = self.client.table("reflections").select("*").eq(
+            ).gte("attempted_at", today.isoformat()).execute)
+            reflection_future = _query_pool.submit(self.client.table("reflections").select("*").eq(
                 "user_id", user_id
-            ).gte("created_at", today.isoformat()).execute()
+            ).gte("created_at", today.isoformat()).execute)
             
+            lessons_today = len(completed_future.result().data)
+            quizzes_today = len(quiz_future.result().data)
+            reflection_response = reflection_future.result()
             reflections_today = len(reflection_response.data) if reflection_response.data else 0
             
             # Daily challenge: 1 lesson, 1 quiz, 1 reflection, 10 flashcards (we'll assume flashcards for now)
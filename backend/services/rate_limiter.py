@@ -0,0 +1,70 @@
+"""
+Rate Limiter for outbound generation calls
+Async token bucket: allows bursts up to max_rate, then paces to the refill rate
+"""
+import asyncio
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncRateLimiter:
+    """
+    Token-bucket rate limiter for asyncio code.
+    Use as `async with limiter:` around each rate-limited call.
+    Shared safely between concurrent tasks.
+    """
+
+    def __init__(self, max_rate: float, time_period: float = 60.0):
+        """
+        Args:
+            max_rate: Calls allowed per time_period (also the burst size)
+            time_period: Window length in seconds
+        """
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._refill_rate = max_rate / time_period  # tokens per second
+        self._tokens = float(max_rate)
+        self._last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        """Add tokens earned since the last refill"""
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._tokens = min(self.max_rate, self._tokens + elapsed * self._refill_rate)
+        self._last_refill = now
+
+    async def acquire(self):
+        """Wait until a token is available, then take it"""
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                wait = (1 - self._tokens) / self._refill_rate
+                logger.debug(f"Rate limit reached, waiting {wait:.2f}s")
+                await asyncio.sleep(wait)
+                self._refill()
+            self._tokens -= 1
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+# Calls per minute shared by the lesson/path generation scripts
+GENERATION_RATE_PER_MINUTE = 20
+
+# Global limiter instance
+_generation_limiter = None
+
+
+def get_generation_rate_limiter() -> AsyncRateLimiter:
+    """Get or create the limiter shared by content generation calls"""
+    global _generation_limiter
+    if _generation_limiter is None:
+        _generation_limiter = AsyncRateLimiter(GENERATION_RATE_PER_MINUTE, 60.0)
+    return _generation_limiter
@@ -5,6 +5,7 @@ from abc import ABC, abstractmethod
 from typing import List, Optional
 import asyncio
 import logging
+import aiohttp
 from datetime import datetime
 
 from .content_models import NormalizedContent
@@ -29,6 +30,8 @@ class SourceAdapter(ABC):
         self.timeout = timeout
         self.max_retries = max_retries
         self.retry_delays = [1, 2, 4]  # Exponential backoff delays in seconds
+        self.max_retry_after = 30  # Cap on server-requested Retry-After waits
+        self._session: Optional[aiohttp.ClientSession] = None
         
     @abstractmethod
     async def fetch(self, topic: str, limit: int = 5) -> List[dict]:
@@ -137,12 +140,70 @@ class SourceAdapter(ABC):
             
             # Wait before retrying (except on last attempt)
             if attempt < self.max_retries - 1:
-                delay = self.retry_delays[min(attempt, len(self.retry_delays) - 1)]
+                delay = self._get_retry_after(last_exception)
+                if delay is None:
+                    delay = self.retry_delays[min(attempt, len(self.retry_delays) - 1)]
                 await asyncio.sleep(delay)
         
         # All retries failed
         raise last_exception
     
+    def _get_retry_after(self, error: Exception) -> Optional[float]:
+        """
+        Get the server-requested wait from a rate-limited (429) error.
+        
+        Works with aiohttp.ClientResponseError and httpx.HTTPStatusError.
+        
+        Args:
+            error: Exception raised by the request
+            
+        Returns:
+            Seconds to wait (capped at max_retry_after), or None to use
+            the default backoff
+        """
+        response = getattr(error, 'response', None)
+        status = getattr(error, 'status', None) or getattr(response, 'status_code', None)
+        if status != 429:
+            return None
+        
+        headers = getattr(error, 'headers', None) or getattr(response, 'headers', None) or {}
+        try:
+            retry_after = float(headers.get('Retry-After'))
+        except (TypeError, ValueError):
+            # Missing or HTTP-date form: fall back to the longest backoff step
+            return float(self.retry_delays[-1])
+        
+        return min(max(retry_after, 0.0), self.max_retry_after)
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the aiohttp session shared by this adapter's requests.
+        Created on first use and kept open, so calls reuse pooled keep-alive
+        connections and cached DNS instead of a new TCP+TLS handshake each time.
+        The connector caps concurrent connections per host so bursty topic
+        fan-outs queue locally instead of being refused upstream.
+        
+        Returns:
+            Open aiohttp.ClientSession
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=64,
+                    limit_per_host=8,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=75,
+                ),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+        return self._session
+    
+    async def close(self):
+        """Close the shared aiohttp session, if one was opened"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
     def _handle_rate_limit(self, response) -> bool:
         """
         Check if response indicates rate limiting.
@@ -76,13 +76,16 @@ async def test_content_orchestrator():
     field = "science"
     
     print(f"\nFetching content for: {topic}")
-    content = await orchestrator.fetch_multi_source(
-        field=field,
-        topic=topic,
-        num_sources=3,
-        items_per_source=2,
-        use_cache=False
-    )
+    try:
+        content = await orchestrator.fetch_multi_source(
+            field=field,
+            topic=topic,
+            num_sources=3,
+            items_per_source=2,
+            use_cache=False
+        )
+    finally:
+        await orchestrator.close_all()
     
     print(f"\nFetched {len(content)} items:")
     for item in content:
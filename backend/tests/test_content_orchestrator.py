@@ -2,6 +2,7 @@
 Tests for Content Orchestrator
 """
 import pytest
+import asyncio
 from unittest.mock import AsyncMock, patch, MagicMock
 from datetime import datetime
 
@@ -391,6 +392,27 @@ async def test_fetch_with_cache_hit(orchestrator, mock_content):
     assert len(results1) == len(results2)
 
 
+@pytest.mark.asyncio
+async def test_concurrent_cache_misses_share_one_fetch(orchestrator, mock_content):
+    """Test that identical concurrent misses make a single adapter call"""
+    await orchestrator.cache.clear()
+    
+    async def slow_fetch(topic, limit):
+        await asyncio.sleep(0.05)
+        return mock_content[:1]
+    
+    adapter = orchestrator.adapters["arxiv"]
+    adapter.fetch_and_normalize = AsyncMock(side_effect=slow_fetch)
+    
+    results = await asyncio.gather(*(
+        orchestrator._fetch_with_cache("arxiv", adapter, "coalesce_test_topic", 3)
+        for _ in range(5)
+    ))
+    
+    assert adapter.fetch_and_normalize.call_count == 1
+    assert all(r == mock_content[:1] for r in results)
+
+
 @pytest.mark.asyncio
 async def test_fetch_without_cache(orchestrator, mock_content):
     """Test fetching with cache disabled"""
@@ -130,6 +130,7 @@ async def test_get_tickers_for_topic():
     # Test direct ticker symbol
     direct_tickers = adapter._get_tickers_for_topic("TSLA")
     assert direct_tickers == ["TSLA"]
+    assert adapter._get_tickers_for_topic("BTC-USD") == ["BTC-USD"]
     
     # Test default (market indices)
     default_tickers = adapter._get_tickers_for_topic("unknown topic")
@@ -160,6 +161,27 @@ async def test_normalize_handles_missing_data():
     assert "Unknown" in normalized.content
 
 
+@pytest.mark.asyncio
+async def test_normalize_fast_info_omits_company_details(mock_ticker_history):
+    """Test that fields only .info provides are left out rather than shown as Unknown"""
+    adapter = FinanceAdapter()
+    
+    raw_content = {
+        "ticker": "AAPL",
+        "info": {"marketCap": 3000000000000, "currency": "USD"},
+        "history": mock_ticker_history,
+        "current_price": 185.0,
+        "previous_close": 183.0
+    }
+    
+    normalized = adapter.normalize(raw_content)
+    
+    assert normalized.title == "AAPL Price Overview"
+    assert "Sector" not in normalized.content
+    assert "Unknown" not in normalized.content
+    assert "Market Cap: $3000.00B" in normalized.content
+
+
 @pytest.mark.asyncio
 async def test_get_source_name():
     """Test source name is correct"""
@@ -167,17 +189,25 @@ async def test_get_source_name():
     assert adapter.get_source_name() == "finance"
 
 
+def batched_download(history):
+    """Build a yf.download stand-in returning history grouped per ticker"""
+    def download(tickers, **kwargs):
+        return pd.concat({ticker: history for ticker in tickers}, axis=1)
+    return download
+
+
 @pytest.mark.asyncio
+@patch('yfinance.download')
 @patch('yfinance.Ticker')
-async def test_fetch_with_mocked_yfinance(mock_ticker_class, mock_ticker_info, mock_ticker_history):
+async def test_fetch_with_mocked_yfinance(mock_ticker_class, mock_download, mock_ticker_info, mock_ticker_history):
     """Test fetching data with mocked yfinance"""
     adapter = FinanceAdapter()
     
-    # Mock the Ticker instance
+    # Mock the Ticker instance and the batched history download
     mock_ticker = MagicMock()
     mock_ticker.info = mock_ticker_info
-    mock_ticker.history.return_value = mock_ticker_history
     mock_ticker_class.return_value = mock_ticker
+    mock_download.side_effect = batched_download(mock_ticker_history)
     
     # Fetch data
     results = await adapter.fetch("AAPL", limit=1)
@@ -185,16 +215,37 @@ async def test_fetch_with_mocked_yfinance(mock_ticker_class, mock_ticker_info, m
     assert len(results) == 1
     assert results[0]["ticker"] == "AAPL"
     assert results[0]["current_price"] == 185.0
+    mock_download.assert_called_once()
 
 
 @pytest.mark.asyncio
+@patch('yfinance.download')
 @patch('yfinance.Ticker')
-async def test_fetch_handles_errors(mock_ticker_class):
+async def test_fetch_uses_full_info_only_when_requested(mock_ticker_class, mock_download, mock_ticker_info, mock_ticker_history):
+    """Test that the full .info scrape is skipped unless full_info is set"""
+    mock_ticker = MagicMock()
+    mock_ticker.info = mock_ticker_info
+    mock_ticker.fast_info = MagicMock(market_cap=3000000000000, currency="USD")
+    mock_ticker_class.return_value = mock_ticker
+    mock_download.side_effect = batched_download(mock_ticker_history)
+    
+    results = await FinanceAdapter().fetch("AAPL", limit=1)
+    assert results[0]["info"] == {"marketCap": 3000000000000, "currency": "USD"}
+    
+    results = await FinanceAdapter(full_info=True).fetch("AAPL", limit=1)
+    assert results[0]["info"] == mock_ticker_info
+
+
+@pytest.mark.asyncio
+@patch('yfinance.download')
+@patch('yfinance.Ticker')
+async def test_fetch_handles_errors(mock_ticker_class, mock_download):
     """Test that fetch handles errors gracefully"""
     adapter = FinanceAdapter()
     
-    # Mock ticker that raises an exception
+    # Mock ticker and download that raise exceptions
     mock_ticker_class.side_effect = Exception("API Error")
+    mock_download.side_effect = Exception("API Error")
     
     # Should return empty list on error
     results = await adapter.fetch("INVALID", limit=1)
@@ -203,16 +254,17 @@ async def test_fetch_handles_errors(mock_ticker_class):
 
 
 @pytest.mark.asyncio
+@patch('yfinance.download')
 @patch('yfinance.Ticker')
-async def test_fetch_and_normalize_integration(mock_ticker_class, mock_ticker_info, mock_ticker_history):
+async def test_fetch_and_normalize_integration(mock_ticker_class, mock_download, mock_ticker_info, mock_ticker_history):
     """Test the full fetch and normalize pipeline"""
     adapter = FinanceAdapter()
     
-    # Mock the Ticker instance
+    # Mock the Ticker instance and the batched history download
     mock_ticker = MagicMock()
-    mock_ticker.info = mock_ticker_info
-    mock_ticker.history.return_value = mock_ticker_history
+    mock_ticker.fast_info = MagicMock(market_cap=3000000000000, currency="USD")
     mock_ticker_class.return_value = mock_ticker
+    mock_download.side_effect = batched_download(mock_ticker_history)
     
     # Test fetch_and_normalize
     results = await adapter.fetch_and_normalize("tech", limit=2)
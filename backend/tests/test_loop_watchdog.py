@@ -0,0 +1,42 @@
+"""
+Tests for the event loop watchdog
+"""
+import pytest
+import asyncio
+import logging
+import sys
+import time
+
+from services.loop_watchdog import start_loop_watchdog
+
+
+@pytest.mark.asyncio
+async def test_watchdog_logs_event_loop_stall(caplog):
+    """Test that a blocking call inside the loop is reported"""
+    caplog.set_level(logging.WARNING, logger="services.loop_watchdog")
+    watchdog = start_loop_watchdog(interval=0.01, threshold=0.05)
+    try:
+        await asyncio.sleep(0.02)
+        time.sleep(0.15)  # Block the loop on purpose
+        await asyncio.sleep(0.05)
+    finally:
+        watchdog.cancel()
+
+    messages = [record.getMessage() for record in caplog.records]
+    assert any("Event loop stalled" in m for m in messages)
+    if sys.version_info >= (3, 13):
+        assert any("Blocking time.sleep" in m for m in messages)
+
+
+@pytest.mark.asyncio
+async def test_watchdog_quiet_when_loop_is_free(caplog):
+    """Test that non-blocking awaits produce no warnings"""
+    caplog.set_level(logging.WARNING, logger="services.loop_watchdog")
+    watchdog = start_loop_watchdog(interval=0.01, threshold=0.05)
+    try:
+        await asyncio.sleep(0.1)
+        await asyncio.to_thread(time.sleep, 0.01)  # Sleeping off-loop is fine
+    finally:
+        watchdog.cancel()
+
+    assert not [r for r in caplog.records if r.levelno >= logging.WARNING]
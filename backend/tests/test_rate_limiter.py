@@ -0,0 +1,56 @@
+"""
+Tests for the async token-bucket rate limiter
+"""
+import pytest
+import asyncio
+import time
+
+from services.rate_limiter import AsyncRateLimiter, get_generation_rate_limiter
+
+
+@pytest.mark.asyncio
+async def test_burst_up_to_max_rate_without_waiting():
+    """Test that a full bucket allows max_rate calls immediately"""
+    limiter = AsyncRateLimiter(max_rate=5, time_period=60)
+
+    start = time.monotonic()
+    for _ in range(5):
+        async with limiter:
+            pass
+
+    assert time.monotonic() - start < 0.05
+
+
+@pytest.mark.asyncio
+async def test_waits_for_refill_when_empty():
+    """Test that calls past the burst are paced to the refill rate"""
+    limiter = AsyncRateLimiter(max_rate=2, time_period=0.2)  # 1 token per 0.1s
+
+    await limiter.acquire()
+    await limiter.acquire()
+
+    start = time.monotonic()
+    await limiter.acquire()
+
+    assert time.monotonic() - start >= 0.08
+
+
+@pytest.mark.asyncio
+async def test_shared_between_concurrent_tasks():
+    """Test that concurrent tasks draw from one bucket"""
+    limiter = AsyncRateLimiter(max_rate=3, time_period=0.3)  # 1 token per 0.1s
+
+    async def call():
+        async with limiter:
+            return time.monotonic()
+
+    start = time.monotonic()
+    times = await asyncio.gather(*(call() for _ in range(5)))
+
+    # 3 immediate, then 2 more paced ~0.1s apart
+    assert max(times) - start >= 0.18
+
+
+def test_get_generation_rate_limiter_singleton():
+    """Test that the generation limiter is shared"""
+    assert get_generation_rate_limiter() is get_generation_rate_limiter()
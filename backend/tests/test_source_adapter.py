@@ -101,6 +101,44 @@ async def test_timeout_handling():
         await adapter._retry_request(slow_request)
 
 
+class RateLimitError(Exception):
+    """Mimics aiohttp.ClientResponseError for a 429 response"""
+    
+    def __init__(self, headers):
+        super().__init__("Too Many Requests")
+        self.status = 429
+        self.headers = headers
+
+
+@pytest.mark.asyncio
+async def test_retry_honors_retry_after(monkeypatch):
+    """Test that 429 responses wait for the server's Retry-After"""
+    adapter = MockAdapter(timeout=1, max_retries=2)
+    delays = []
+    
+    async def fake_sleep(delay):
+        delays.append(delay)
+    
+    monkeypatch.setattr("services.source_adapter.asyncio.sleep", fake_sleep)
+    
+    async def rate_limited_request():
+        raise RateLimitError({"Retry-After": "7"})
+    
+    with pytest.raises(RateLimitError):
+        await adapter._retry_request(rate_limited_request)
+    
+    assert delays == [7.0]
+
+
+def test_retry_after_capped_and_ignored_for_other_errors():
+    """Test Retry-After parsing edge cases"""
+    adapter = MockAdapter()
+    
+    assert adapter._get_retry_after(RateLimitError({"Retry-After": "3600"})) == adapter.max_retry_after
+    assert adapter._get_retry_after(RateLimitError({})) == adapter.retry_delays[-1]
+    assert adapter._get_retry_after(Exception("boom")) is None
+
+
 def test_get_source_name():
     """Test source name extraction"""
     adapter = MockAdapter()
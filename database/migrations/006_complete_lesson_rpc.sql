@@ -0,0 +1,79 @@
+-- Migration 006: complete_lesson RPC
+-- Marks a lesson completed and updates user_stats in a single atomic call,
+-- replacing the select/upsert/select/update sequence in ProgressService
+
+CREATE OR REPLACE FUNCTION complete_lesson(
+    p_user UUID,
+    p_lesson UUID,
+    p_time_spent_seconds INT DEFAULT 300
+)
+RETURNS JSONB AS $$
+DECLARE
+    v_points INT;
+    v_category_id UUID;
+    v_progress_id UUID;
+    v_last_activity DATE;
+    v_streak INT;
+    today DATE := CURRENT_DATE;
+BEGIN
+    SELECT COALESCE(points, 10), category_id
+    INTO v_points, v_category_id
+    FROM lessons
+    WHERE id = p_lesson;
+
+    IF NOT FOUND THEN
+        RAISE EXCEPTION 'Lesson % not found', p_lesson USING ERRCODE = 'P0002';
+    END IF;
+
+    -- Upsert progress; rows that are already completed are left untouched
+    INSERT INTO user_progress (
+        user_id, lesson_id, category_id, completed,
+        points_earned, time_spent_seconds, completed_at
+    )
+    VALUES (p_user, p_lesson, v_category_id, true, v_points, p_time_spent_seconds, NOW())
+    ON CONFLICT (user_id, lesson_id) DO UPDATE
+    SET category_id = EXCLUDED.category_id,
+        completed = true,
+        points_earned = EXCLUDED.points_earned,
+        time_spent_seconds = EXCLUDED.time_spent_seconds,
+        completed_at = EXCLUDED.completed_at
+    WHERE user_progress.completed IS NOT TRUE
+    RETURNING id INTO v_progress_id;
+
+    IF v_progress_id IS NULL THEN
+        RETURN jsonb_build_object('status', 'already_completed', 'points_earned', 0);
+    END IF;
+
+    -- Lock the stats row so concurrent completions don't lose updates
+    INSERT INTO user_stats (user_id) VALUES (p_user)
+    ON CONFLICT (user_id) DO NOTHING;
+
+    SELECT last_activity_date, COALESCE(current_streak, 0)
+    INTO v_last_activity, v_streak
+    FROM user_stats
+    WHERE user_id = p_user
+    FOR UPDATE;
+
+    IF v_last_activity IS NULL OR v_last_activity < today - 1 THEN
+        v_streak := 1;
+    ELSIF v_last_activity = today - 1 THEN
+        v_streak := v_streak + 1;
+    END IF;
+
+    UPDATE user_stats
+    SET total_points = COALESCE(total_points, 0) + v_points,
+        lessons_completed = COALESCE(lessons_completed, 0) + 1,
+        current_streak = v_streak,
+        longest_streak = GREATEST(COALESCE(longest_streak, 0), v_streak),
+        total_study_time_minutes = COALESCE(total_study_time_minutes, 0) + p_time_spent_seconds / 60,
+        last_activity_date = today,
+        updated_at = NOW()
+    WHERE user_id = p_user;
+
+    RETURN jsonb_build_object(
+        'status', 'completed',
+        'points_earned', v_points,
+        'lesson_id', p_lesson
+    );
+END;
+$$ LANGUAGE plpgsql;
@@ -0,0 +1,27 @@
+-- Migration 007: lesson_detail_v view
+-- Returns a lesson with its quiz questions aggregated in one row, so the
+-- detail endpoint needs a single query instead of one per related table.
+-- quizzes.lesson_id has no foreign key (it may point at synthesized_lessons),
+-- so PostgREST cannot embed it and the join lives here instead.
+
+CREATE OR REPLACE VIEW lesson_detail_v AS
+SELECT
+    l.*,
+    COALESCE(q.quiz_questions, '[]'::jsonb) AS quiz_questions
+FROM lessons l
+LEFT JOIN LATERAL (
+    SELECT jsonb_agg(
+        jsonb_build_object(
+            'id', qz.id,
+            'question', qz.question,
+            'options', qz.options,
+            'correct_answer', qz.correct_answer,
+            'explanation', qz.explanation,
+            'points', qz.points
+        ) ORDER BY qz.created_at
+    ) AS quiz_questions
+    FROM quizzes qz
+    WHERE qz.lesson_id = l.id
+) q ON true;
+
+COMMENT ON VIEW lesson_detail_v IS 'Lessons with quiz questions aggregated for the detail endpoint';
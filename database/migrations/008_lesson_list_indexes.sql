@@ -0,0 +1,23 @@
+-- Migration 008: Indexes for the /api/lessons listing query
+-- get_lessons filters on field_id and/or difficulty_level and orders by
+-- created_at DESC LIMIT 50; these let Postgres read rows in index order and
+-- stop after 50 instead of sorting the whole filtered set.
+--
+-- CONCURRENTLY avoids locking lessons against writes while the indexes build.
+-- It cannot run inside a transaction block, so run this file with psql
+-- (or statement by statement in the Supabase SQL editor).
+--
+-- user_progress already has UNIQUE(user_id, lesson_id), which is the index
+-- backing the complete_lesson upsert conflict target, so none is added here.
+
+-- field_id (+ difficulty_level) filters
+CREATE INDEX CONCURRENTLY IF NOT EXISTS lessons_field_diff_created_idx
+    ON lessons (field_id, difficulty_level, created_at DESC);
+
+-- difficulty_level-only filter
+CREATE INDEX CONCURRENTLY IF NOT EXISTS lessons_diff_created_idx
+    ON lessons (difficulty_level, created_at DESC);
+
+-- Unfiltered listing
+CREATE INDEX CONCURRENTLY IF NOT EXISTS lessons_created_idx
+    ON lessons (created_at DESC);
@@ -0,0 +1,42 @@
+-- Migration 009: list_lessons RPC
+-- Builds the /api/lessons list-view JSON in one server-side aggregation:
+-- content is truncated to 500 characters and difficulty_level lowercased here
+-- instead of per row in Python. Uses the indexes from migration 008.
+
+CREATE OR REPLACE FUNCTION list_lessons(
+    p_field_id TEXT DEFAULT NULL,
+    p_difficulty TEXT DEFAULT NULL,
+    p_limit INT DEFAULT 50
+)
+RETURNS JSONB AS $$
+    SELECT COALESCE(
+        jsonb_agg(
+            jsonb_build_object(
+                'id', l.id,
+                'field_id', l.field_id,
+                'field_name', l.field_name,
+                'title', l.title,
+                'content', left(l.content, 500),
+                'difficulty_level', lower(l.difficulty_level),
+                'estimated_minutes', l.estimated_minutes,
+                'learning_objectives', l.learning_objectives,
+                'key_concepts', l.key_concepts,
+                'video_url', l.video_url,
+                'video_duration_seconds', l.video_duration_seconds,
+                'sources', l.sources,
+                'created_at', l.created_at,
+                'is_generated', true,
+                'is_auto_generated', l.is_auto_generated
+            ) ORDER BY l.created_at DESC
+        ),
+        '[]'::jsonb
+    )
+    FROM (
+        SELECT *
+        FROM lessons
+        WHERE (p_field_id IS NULL OR field_id = p_field_id)
+          AND (p_difficulty IS NULL OR difficulty_level = p_difficulty)
+        ORDER BY created_at DESC
+        LIMIT p_limit
+    ) l;
+$$ LANGUAGE sql STABLE;
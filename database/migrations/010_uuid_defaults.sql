@@ -0,0 +1,18 @@
+-- Migration 010: Database-side id defaults
+-- Progress, quiz attempt, stats and flashcard rows get their ids from
+-- gen_random_uuid() on insert, so the API no longer generates and sends them.
+
+ALTER TABLE user_progress ALTER COLUMN id SET DEFAULT gen_random_uuid();
+ALTER TABLE quiz_attempts ALTER COLUMN id SET DEFAULT gen_random_uuid();
+ALTER TABLE flashcards ALTER COLUMN id SET DEFAULT gen_random_uuid();
+
+-- user_stats only has an id column when it was created by migration 002
+DO $$ 
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns 
+        WHERE table_name = 'user_stats' AND column_name = 'id'
+    ) THEN
+        ALTER TABLE user_stats ALTER COLUMN id SET DEFAULT gen_random_uuid();
+    END IF;
+END $$;
@@ -0,0 +1,18 @@
+-- Migration 011: Store lessons.difficulty_level in lowercase
+-- The API used to lowercase difficulty_level on every row it returned;
+-- normalize existing rows once and keep new rows lowercase with a CHECK.
+
+UPDATE lessons
+SET difficulty_level = lower(difficulty_level)
+WHERE difficulty_level <> lower(difficulty_level);
+
+DO $$ 
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM information_schema.table_constraints 
+        WHERE table_name = 'lessons' AND constraint_name = 'difficulty_lower'
+    ) THEN
+        ALTER TABLE lessons ADD CONSTRAINT difficulty_lower
+            CHECK (difficulty_level = lower(difficulty_level));
+    END IF;
+END $$;
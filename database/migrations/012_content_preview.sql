@@ -0,0 +1,49 @@
+-- Migration 012: lessons.content_preview
+-- Stores the 500-character list-view preview alongside the lesson, so the
+-- listing no longer reads (and de-TOASTs) full lesson bodies to truncate them.
+
+ALTER TABLE lessons
+    ADD COLUMN IF NOT EXISTS content_preview TEXT
+    GENERATED ALWAYS AS (left(content, 500)) STORED;
+
+-- list_lessons (migration 009) now serves the stored preview as "content";
+-- difficulty_level is already lowercase (migration 011)
+CREATE OR REPLACE FUNCTION list_lessons(
+    p_field_id TEXT DEFAULT NULL,
+    p_difficulty TEXT DEFAULT NULL,
+    p_limit INT DEFAULT 50
+)
+RETURNS JSONB AS $$
+    SELECT COALESCE(
+        jsonb_agg(
+            jsonb_build_object(
+                'id', l.id,
+                'field_id', l.field_id,
+                'field_name', l.field_name,
+                'title', l.title,
+                'content', l.content_preview,
+                'difficulty_level', l.difficulty_level,
+                'estimated_minutes', l.estimated_minutes,
+                'learning_objectives', l.learning_objectives,
+                'key_concepts', l.key_concepts,
+                'video_url', l.video_url,
+                'video_duration_seconds', l.video_duration_seconds,
+                'sources', l.sources,
+                'created_at', l.created_at,
+                'is_generated', true,
+                'is_auto_generated', l.is_auto_generated
+            ) ORDER BY l.created_at DESC
+        ),
+        '[]'::jsonb
+    )
+    FROM (
+        SELECT id, field_id, field_name, title, content_preview, difficulty_level,
+               estimated_minutes, learning_objectives, key_concepts, video_url,
+               video_duration_seconds, sources, created_at, is_auto_generated
+        FROM lessons
+        WHERE (p_field_id IS NULL OR field_id = p_field_id)
+          AND (p_difficulty IS NULL OR difficulty_level = p_difficulty)
+        ORDER BY created_at DESC
+        LIMIT p_limit
+    ) l;
+$$ LANGUAGE sql STABLE;
@@ -0,0 +1,64 @@
+-- Migration 013: seed_all RPC
+-- Upserts the seed fields, lessons and quiz questions in one transaction,
+-- replacing the three sequential upserts in backend/seed_database.py.
+-- Rows are inserted in foreign-key order and sorted by primary key.
+-- Columns are listed explicitly: omitted ones keep their defaults
+-- (is_published, points, updated_at, lesson_type) and the generated
+-- lessons.content_preview (migration 012) is never written.
+
+CREATE OR REPLACE FUNCTION seed_all(
+    p_fields JSONB,
+    p_lessons JSONB,
+    p_quiz_questions JSONB
+)
+RETURNS JSONB AS $$
+BEGIN
+    INSERT INTO fields (id, name, description, icon, color, total_lessons, created_at)
+    SELECT r.id, r.name, r.description, r.icon, r.color, r.total_lessons, r.created_at
+    FROM jsonb_populate_recordset(NULL::fields, p_fields) AS r
+    ORDER BY r.id
+    ON CONFLICT (id) DO UPDATE SET
+        name = EXCLUDED.name,
+        description = EXCLUDED.description,
+        icon = EXCLUDED.icon,
+        color = EXCLUDED.color,
+        total_lessons = EXCLUDED.total_lessons,
+        created_at = EXCLUDED.created_at;
+
+    INSERT INTO lessons (id, title, content, field_id, field_name, difficulty_level, estimated_minutes,
+        learning_objectives, key_concepts, sources, is_auto_generated, created_at)
+    SELECT r.id, r.title, r.content, r.field_id, r.field_name, r.difficulty_level, r.estimated_minutes,
+        r.learning_objectives, r.key_concepts, r.sources, r.is_auto_generated, r.created_at
+    FROM jsonb_populate_recordset(NULL::lessons, p_lessons) AS r
+    ORDER BY r.id
+    ON CONFLICT (id) DO UPDATE SET
+        title = EXCLUDED.title,
+        content = EXCLUDED.content,
+        field_id = EXCLUDED.field_id,
+        field_name = EXCLUDED.field_name,
+        difficulty_level = EXCLUDED.difficulty_level,
+        estimated_minutes = EXCLUDED.estimated_minutes,
+        learning_objectives = EXCLUDED.learning_objectives,
+        key_concepts = EXCLUDED.key_concepts,
+        created_at = EXCLUDED.created_at;
+
+    INSERT INTO quiz_questions (id, lesson_id, question, question_type, options, correct_answer, explanation, created_at)
+    SELECT r.id, r.lesson_id, r.question, r.question_type, r.options, r.correct_answer, r.explanation, r.created_at
+    FROM jsonb_populate_recordset(NULL::quiz_questions, p_quiz_questions) AS r
+    ORDER BY r.id
+    ON CONFLICT (id) DO UPDATE SET
+        lesson_id = EXCLUDED.lesson_id,
+        question = EXCLUDED.question,
+        question_type = EXCLUDED.question_type,
+        options = EXCLUDED.options,
+        correct_answer = EXCLUDED.correct_answer,
+        explanation = EXCLUDED.explanation,
+        created_at = EXCLUDED.created_at;
+
+    RETURN jsonb_build_object(
+        'fields', jsonb_array_length(p_fields),
+        'lessons', jsonb_array_length(p_lessons),
+        'quiz_questions', jsonb_array_length(p_quiz_questions)
+    );
+END;
+$$ LANGUAGE plpgsql;
@@ -0,0 +1,84 @@
+-- Migration 014: idempotent seed_all
+-- Re-running the seeder against an already-seeded database no longer
+-- rewrites every row: conflicting rows are only updated when their content
+-- changed, and created_at keeps the value from the first seed.
+-- Returns the number of rows actually written per table.
+-- Columns are listed explicitly so the generated lessons.content_preview
+-- (migration 012) is never written and unlisted columns keep their
+-- defaults; keys the seeder drops as None fall back to the same defaults.
+
+CREATE OR REPLACE FUNCTION seed_all(
+    p_fields JSONB,
+    p_lessons JSONB,
+    p_quiz_questions JSONB
+)
+RETURNS JSONB AS $$
+DECLARE
+    v_fields INT;
+    v_lessons INT;
+    v_quiz_questions INT;
+BEGIN
+    INSERT INTO fields AS t (id, name, description, icon, color, total_lessons, created_at)
+    SELECT r.id, r.name, r.description, r.icon, r.color, r.total_lessons, COALESCE(r.created_at, NOW())
+    FROM jsonb_populate_recordset(NULL::fields, p_fields) AS r
+    ORDER BY r.id
+    ON CONFLICT (id) DO UPDATE SET
+        name = EXCLUDED.name,
+        description = EXCLUDED.description,
+        icon = EXCLUDED.icon,
+        color = EXCLUDED.color,
+        total_lessons = EXCLUDED.total_lessons
+    WHERE (t.name, t.description, t.icon, t.color, t.total_lessons)
+        IS DISTINCT FROM
+        (EXCLUDED.name, EXCLUDED.description, EXCLUDED.icon, EXCLUDED.color, EXCLUDED.total_lessons);
+    GET DIAGNOSTICS v_fields = ROW_COUNT;
+
+    INSERT INTO lessons AS t (id, title, content, field_id, field_name, difficulty_level, estimated_minutes,
+        learning_objectives, key_concepts, sources, is_auto_generated, created_at)
+    SELECT r.id, r.title, r.content, r.field_id, r.field_name,
+        COALESCE(r.difficulty_level, 'beginner'), COALESCE(r.estimated_minutes, 15),
+        r.learning_objectives, r.key_concepts, r.sources,
+        COALESCE(r.is_auto_generated, false), COALESCE(r.created_at, NOW())
+    FROM jsonb_populate_recordset(NULL::lessons, p_lessons) AS r
+    ORDER BY r.id
+    ON CONFLICT (id) DO UPDATE SET
+        title = EXCLUDED.title,
+        content = EXCLUDED.content,
+        field_id = EXCLUDED.field_id,
+        field_name = EXCLUDED.field_name,
+        difficulty_level = EXCLUDED.difficulty_level,
+        estimated_minutes = EXCLUDED.estimated_minutes,
+        learning_objectives = EXCLUDED.learning_objectives,
+        key_concepts = EXCLUDED.key_concepts
+    WHERE (t.title, t.content, t.field_id, t.field_name, t.difficulty_level,
+           t.estimated_minutes, t.learning_objectives, t.key_concepts)
+        IS DISTINCT FROM
+        (EXCLUDED.title, EXCLUDED.content, EXCLUDED.field_id, EXCLUDED.field_name, EXCLUDED.difficulty_level,
+         EXCLUDED.estimated_minutes, EXCLUDED.learning_objectives, EXCLUDED.key_concepts);
+    GET DIAGNOSTICS v_lessons = ROW_COUNT;
+
+    INSERT INTO quiz_questions AS t (id, lesson_id, question, question_type, options, correct_answer, explanation, created_at)
+    SELECT r.id, r.lesson_id, r.question, r.question_type, r.options, r.correct_answer, r.explanation,
+        COALESCE(r.created_at, NOW())
+    FROM jsonb_populate_recordset(NULL::quiz_questions, p_quiz_questions) AS r
+    ORDER BY r.id
+    ON CONFLICT (id) DO UPDATE SET
+        lesson_id = EXCLUDED.lesson_id,
+        question = EXCLUDED.question,
+        question_type = EXCLUDED.question_type,
+        options = EXCLUDED.options,
+        correct_answer = EXCLUDED.correct_answer,
+        explanation = EXCLUDED.explanation
+    WHERE (t.lesson_id, t.question, t.question_type, t.options, t.correct_answer, t.explanation)
+        IS DISTINCT FROM
+        (EXCLUDED.lesson_id, EXCLUDED.question, EXCLUDED.question_type, EXCLUDED.options,
+         EXCLUDED.correct_answer, EXCLUDED.explanation);
+    GET DIAGNOSTICS v_quiz_questions = ROW_COUNT;
+
+    RETURN jsonb_build_object(
+        'fields', v_fields,
+        'lessons', v_lessons,
+        'quiz_questions', v_quiz_questions
+    );
+END;
+$$ LANGUAGE plpgsql;